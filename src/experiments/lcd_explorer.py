@@ -27,26 +27,41 @@ HARDWARE CONTROLS (Push 1 pads - bottom row):
 KEYBOARD CONTROLS:
     c: Cycle chars  x: Special chars  b: VU meter  a: Animation
     s: Scroll       g: Grid           p: Progress  w: Waveform
-    l: Layout       r: Reset menu     q: Quit
+    l: Layout       r: Reset menu     h: Help      q: Quit
 """
 
 import mido
+import os
 import time
 import math
 import sys
 import select
 
+# Push 1 protocol helpers live in the open_push package under src/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from open_push.core.constants import NOTE_TO_PAD
+from open_push.core.hardware import raw_sender
+
 # Push 1 SysEx header
 SYSEX_HEADER = [0x47, 0x7F, 0x15]
+_HEADER_BYTES = bytes(SYSEX_HEADER)
+_SYSEX_START = b'\xF0' + _HEADER_BYTES
 
 # LCD line addresses
 LCD_LINES = {1: 0x18, 2: 0x19, 3: 0x1A, 4: 0x1B}
 
+# LCD write prefix per line: [line address, 0x00, 0x45, 0x00]
+_LINE_PREFIX = {line: bytes([addr, 0x00, 0x45, 0x00]) for line, addr in LCD_LINES.items()}
+
 # Segment configuration
 CHARS_PER_LINE = 68
 CHARS_PER_SEGMENT = 17
 NUM_SEGMENTS = 4
 
+# Cached segment padding string
+_SP17 = " " * CHARS_PER_SEGMENT
+
 # Hardware button CCs (from Push 2 mapping - same as Push 1)
 BUTTONS = {
     # Lower row below LCD (CC 20-27) - Use for demo selection
@@ -75,6 +90,32 @@ COLORS = {
     'purple': 49, 'pink': 57,
 }
 
+# Precomputed trig tables for the animation demos (0.05 rad per step).
+# Demo phases are whole multiples of the step (frame * 0.1 -> index frame * 2),
+# and every demo auto-stops long before the index wraps.
+_TRIG_STEP = 0.05
+_TRIG_MASK = 4095
+_SIN_TABLE = [math.sin(i * _TRIG_STEP) for i in range(_TRIG_MASK + 1)]
+_COS_TABLE = [math.cos(i * _TRIG_STEP) for i in range(_TRIG_MASK + 1)]
+
+# Grid demo patterns (name, char at x/y)
+GRID_PATTERNS = [
+    # Checkerboard
+    ("Checkerboard", lambda x, y: "#" if (x + y) % 2 == 0 else " "),
+    # Diagonal
+    ("Diagonal Lines", lambda x, y: "/" if (x + y) % 4 == 0 else " "),
+    # Dots
+    ("Dot Grid", lambda x, y: "." if x % 4 == 0 and y % 2 == 0 else " "),
+    # Blocks
+    ("Block Pattern", lambda x, y: "#" if x % 8 < 4 else "-"),
+]
+
+# Patterns are static, so render their 3 display rows (LCD lines 2-4) once
+_PATTERN_ROWS = [
+    (name, ["".join(pattern_func(x, y) for x in range(CHARS_PER_LINE)) for y in range(3)])
+    for name, pattern_func in GRID_PATTERNS
+]
+
 
 class LCDExplorer:
     def __init__(self):
@@ -84,6 +125,18 @@ class LCDExplorer:
         self.current_char = 32  # Start at space
         self.animation_running = False
         self.current_demo = None  # Track which demo is running
+        self._raw_send = None  # rtmidi send_message, set by connect()
+        self._ui_init_msgs = self._build_ui_init_msgs()
+
+        # Persistent per-line LCD payloads, overwritten in place on each write
+        self._line_bufs = {
+            line: bytearray(prefix + b' ' * CHARS_PER_LINE)
+            for line, prefix in _LINE_PREFIX.items()
+        }
+
+        # Static character set pages shown by cycle_character_set()
+        self._charset_frames = [self._build_charset_frame(start, 17)
+                                for start in range(0, 128, 17)]
 
     def connect(self):
         """Connect to Push 1 User Port (input and output)."""
@@ -101,6 +154,10 @@ class LCDExplorer:
                 print(f"Input: {port_name}")
                 break
 
+        # SysEx built here is already in range, so skip mido's per-byte
+        # validation and hand it straight to the rtmidi backend when present
+        self._raw_send = raw_sender(self.push_out)
+
         if self.push_out and self.push_in:
             print("Connected to Push 1!")
             return True
@@ -112,8 +169,27 @@ class LCDExplorer:
 
     def send_sysex(self, data):
         """Send SysEx message to Push."""
-        if self.push_out:
-            self.push_out.send(mido.Message('sysex', data=SYSEX_HEADER + data))
+        if self._raw_send:
+            self._raw_send(_SYSEX_START + bytes(data) + b'\xF7')
+        elif self.push_out:
+            self.push_out.send(mido.Message('sysex', data=_HEADER_BYTES + bytes(data)))
+
+    def send_sysex_batch(self, payloads):
+        """Send several SysEx payloads back-to-back.
+
+        Push 1 takes one LCD line per message, so all messages are built
+        first and then flushed in a tight loop with no work in between.
+        """
+        if self._raw_send:
+            frames = [_SYSEX_START + bytes(data) + b'\xF7'
+                      for data in payloads if data]
+            for frame in frames:
+                self._raw_send(frame)
+        elif self.push_out:
+            messages = [mido.Message('sysex', data=_HEADER_BYTES + bytes(data))
+                        for data in payloads if data]
+            for msg in messages:
+                self.push_out.send(msg)
 
     def set_pad_color(self, note, color):
         """Set pad LED color."""
@@ -130,33 +206,58 @@ class LCDExplorer:
         self.send_sysex([0x62, 0x00, 0x01, 0x01])
         time.sleep(0.1)
 
+    def _fill_line_buf(self, line, char_values):
+        """Write char values into the line's persistent payload buffer.
+
+        Truncates to 68 characters and pads the rest with spaces in place,
+        so the buffer always stays [addr, 0x00, 0x45, 0x00] + 68 chars.
+        The buffer is reused by the next write to the same line.
+        """
+        buf = self._line_bufs[line]
+        char_values = char_values[:CHARS_PER_LINE]
+        n = len(char_values)
+        buf[4:4 + n] = char_values
+        buf[4 + n:] = b' ' * (CHARS_PER_LINE - n)
+        return buf
+
+    def lcd_line_data(self, line, text):
+        """Build the SysEx payload for a full LCD line (68 characters)."""
+        if line not in LCD_LINES:
+            return None
+        return self._fill_line_buf(line, text[:CHARS_PER_LINE].encode('ascii', 'replace'))
+
     def set_lcd_line(self, line, text):
         """Set a full LCD line (68 characters)."""
-        if line not in LCD_LINES:
-            return
+        data = self.lcd_line_data(line, text)
+        if data:
+            self.send_sysex(data)
 
-        # Pad or truncate to exactly 68 characters
-        text = text[:CHARS_PER_LINE].ljust(CHARS_PER_LINE)
+    def lcd_raw_data(self, line, char_values):
+        """Build the SysEx payload for an LCD line of raw byte values (0-127).
 
-        line_addr = LCD_LINES[line]
-        data = [line_addr, 0x00, 0x45, 0x00]
-        data.extend([ord(c) if isinstance(c, str) else c for c in text])
-        self.send_sysex(data)
+        char_values may be a list of ints or any bytes-like object
+        (bytes, bytearray, memoryview).
+        """
+        if line not in LCD_LINES:
+            return None
+        return self._fill_line_buf(line, char_values)
 
     def set_lcd_raw(self, line, char_values):
         """Set LCD line with raw byte values (0-127)."""
+        data = self.lcd_raw_data(line, char_values)
+        if data:
+            self.send_sysex(data)
+
+    def lcd_segments_data(self, line, seg0="", seg1="", seg2="", seg3=""):
+        """Build the SysEx payload for an LCD line with 4 segments."""
         if line not in LCD_LINES:
-            return
+            return None
 
-        # Pad to 68 values
-        while len(char_values) < CHARS_PER_LINE:
-            char_values.append(32)  # space
-        char_values = char_values[:CHARS_PER_LINE]
+        # Truncate to 17 chars, left-justify (pad right with spaces)
+        text = "".join([(seg[:CHARS_PER_SEGMENT] + _SP17)[:CHARS_PER_SEGMENT]
+                        for seg in (seg0, seg1, seg2, seg3)])
 
-        line_addr = LCD_LINES[line]
-        data = [line_addr, 0x00, 0x45, 0x00]
-        data.extend(char_values)
-        self.send_sysex(data)
+        return self._fill_line_buf(line, text.encode('ascii', 'replace'))
 
     def set_lcd_segments(self, line, seg0="", seg1="", seg2="", seg3=""):
         """Set LCD line with 4 segments (17 chars each).
@@ -168,67 +269,103 @@ class LCDExplorer:
             line: Line number (1-4)
             seg0-seg3: Text for each segment (max 17 chars each)
         """
+        data = self.lcd_segments_data(line, seg0, seg1, seg2, seg3)
+        if data:
+            self.send_sysex(data)
+
+    def lcd_segments_centered_data(self, line, seg0="", seg1="", seg2="", seg3=""):
+        """Build the SysEx payload for an LCD line with 4 centered segments."""
         if line not in LCD_LINES:
-            return
+            return None
 
-        segments = [seg0, seg1, seg2, seg3]
-        text = ""
-        for seg in segments:
-            # Truncate to 17 chars, left-justify (pad right with spaces)
-            text += seg[:CHARS_PER_SEGMENT].ljust(CHARS_PER_SEGMENT)
+        parts = []
+        for seg in (seg0, seg1, seg2, seg3):
+            # Center within 17 chars (odd width: extra space goes left, like str.center)
+            seg = seg[:CHARS_PER_SEGMENT]
+            margin = CHARS_PER_SEGMENT - len(seg)
+            left = margin // 2 + (margin & 1)
+            parts.append(_SP17[:left] + seg + _SP17[:margin - left])
+        text = "".join(parts)
 
-        line_addr = LCD_LINES[line]
-        data = [line_addr, 0x00, 0x45, 0x00]
-        data.extend([ord(c) for c in text])
-        self.send_sysex(data)
+        return self._fill_line_buf(line, text.encode('ascii', 'replace'))
 
     def set_lcd_segments_centered(self, line, seg0="", seg1="", seg2="", seg3=""):
         """Set LCD line with 4 centered segments (17 chars each)."""
-        if line not in LCD_LINES:
-            return
-
-        segments = [seg0, seg1, seg2, seg3]
-        text = ""
-        for seg in segments:
-            # Center within 17 chars
-            text += seg[:CHARS_PER_SEGMENT].center(CHARS_PER_SEGMENT)
-
-        line_addr = LCD_LINES[line]
-        data = [line_addr, 0x00, 0x45, 0x00]
-        data.extend([ord(c) for c in text])
-        self.send_sysex(data)
+        data = self.lcd_segments_centered_data(line, seg0, seg1, seg2, seg3)
+        if data:
+            self.send_sysex(data)
 
     def clear_display(self):
         """Clear all LCD lines."""
         for line in range(1, 5):
             self.set_lcd_line(line, "")
 
-    def show_character_set(self, start=0, count=68):
-        """Display a range of the character set."""
-        chars = list(range(start, min(start + count, 128)))
-        while len(chars) < 68:
-            chars.append(32)
-
-        self.set_lcd_line(1, f"Character Set: {start:3d} - {min(start+count-1, 127):3d}")
-        self.set_lcd_line(2, "-" * 68)
-        self.set_lcd_raw(3, chars)
+    def _build_charset_frame(self, start, count):
+        """Build the 4 LCD line payloads showing a range of the character set."""
+        # lcd_raw_data pads the rest of the line with spaces
+        chars = bytes(range(start, min(start + count, 128)))
 
         # Show hex values below
         hex_line = ""
         for i in range(min(17, count)):
             hex_line += f"{(start + i):02X} "
-        self.set_lcd_line(4, hex_line)
+
+        # Copy out of the shared line buffers so the frame can be kept
+        return [
+            bytes(self.lcd_line_data(1, f"Character Set: {start:3d} - {min(start+count-1, 127):3d}")),
+            bytes(self.lcd_line_data(2, "-" * 68)),
+            bytes(self.lcd_raw_data(3, chars)),
+            bytes(self.lcd_line_data(4, hex_line)),
+        ]
+
+    def show_character_set(self, start=0, count=68):
+        """Display a range of the character set."""
+        self.send_sysex_batch(self._build_charset_frame(start, count))
+
+    def _await_keypress(self, prompt="", timeout=None):
+        """Wait for a line of keyboard input without blocking on input().
+
+        Polls stdin with select (like run()) while draining Push input:
+        any pad press counts as Enter and the Session button as 'q'.
+        Other notes (e.g. encoder touches) are ignored.
+
+        Returns:
+            The stripped input line, or None if the timeout expired.
+        """
+        if prompt:
+            print(prompt, end='', flush=True)
+
+        deadline = None if timeout is None else time.perf_counter() + timeout
+        while True:
+            if self.push_in:
+                for msg in self.push_in.iter_pending():
+                    if (msg.type == 'note_on' and msg.velocity > 0
+                            and NOTE_TO_PAD[msg.note]):
+                        print()
+                        return ''
+                    if (msg.type == 'control_change' and msg.value > 0
+                            and msg.control == BUTTONS['session']):
+                        print()
+                        return 'q'
+
+            wait = 0.05
+            if deadline is not None:
+                wait = max(0.0, min(wait, deadline - time.perf_counter()))
+            if select.select([sys.stdin], [], [], wait)[0]:
+                return sys.stdin.readline().strip()
+            if deadline is not None and time.perf_counter() >= deadline:
+                return None
 
     def cycle_character_set(self):
         """Cycle through the entire character set."""
         print("\nCycling through character set (0-127)")
-        print("Press Enter to advance, 'q' to stop\n")
+        print("Press Enter (or any pad) to advance, 'q' (or Session) to stop\n")
 
-        for start in range(0, 128, 17):
-            self.show_character_set(start, 17)
+        for start, frame in zip(range(0, 128, 17), self._charset_frames):
+            self.send_sysex_batch(frame)
             print(f"Showing characters {start} - {min(start+16, 127)}")
 
-            user_input = input("Enter to continue, 'q' to quit: ")
+            user_input = self._await_keypress("Enter to continue, 'q' to quit: ")
             if user_input.lower() == 'q':
                 break
 
@@ -251,17 +388,16 @@ class LCDExplorer:
             self.set_lcd_line(1, f"Character {char_code:3d} (0x{char_code:02X})".center(68))
 
             # Line 2: Show the character repeated many times for visibility
-            char_row = [char_code] * 68
+            char = bytes([char_code])
+            char_row = char * 68
             self.set_lcd_raw(2, char_row)
 
             # Line 3: Show alternating with spaces for comparison
-            alt_row = []
-            for _ in range(34):
-                alt_row.extend([char_code, 32])  # char, space, char, space...
+            alt_row = (char + b' ') * 34  # char, space, char, space...
             self.set_lcd_raw(3, alt_row)
 
             # Line 4: Mix with known solid block for comparison
-            compare_row = [2] * 17 + [32] * 2 + [char_code] * 17 + [32] * 2 + [2] * 17 + [32] * 2 + [char_code] * 11
+            compare_row = b'\x02' * 17 + b'  ' + char * 17 + b'  ' + b'\x02' * 17 + b'  ' + char * 11
             self.set_lcd_raw(4, compare_row)
 
             # Console output
@@ -271,7 +407,7 @@ class LCDExplorer:
             print("  Line 3: Alternating with spaces")
             print("  Line 4: Compared with solid block (char 2)")
 
-            user_input = input("  Description (or Enter to skip, 'q' to quit): ").strip()
+            user_input = self._await_keypress("  Description (or Enter to skip, 'q' to quit): ")
 
             if user_input.lower() == 'q':
                 break
@@ -301,6 +437,11 @@ class LCDExplorer:
         # Test different update speeds
         test_rates = [0.1, 0.05, 0.02, 0.01, 0.005]
 
+        # Scrolling marker is copied into one reused line buffer each frame
+        marker = b'>>>SCROLLING>>>'
+        blank = b' ' * 68
+        frame_buf = bytearray(blank)
+
         for rate in test_rates:
             if not self.animation_running:
                 break
@@ -308,17 +449,22 @@ class LCDExplorer:
             print(f"Testing {1/rate:.0f} updates/second (delay: {rate*1000:.0f}ms)")
 
             frames = 0
-            start_time = time.time()
+            start_time = time.perf_counter()
+            deadline = start_time
 
-            while time.time() - start_time < 2.0 and self.animation_running:
+            while time.perf_counter() - start_time < 2.0 and self.animation_running:
                 # Simple scrolling animation
                 offset = frames % 68
-                line = " " * offset + ">>>SCROLLING>>>" + " " * 68
-                self.set_lcd_line(2, line[:68])
+                end = min(68, offset + len(marker))
+                frame_buf[:] = blank
+                frame_buf[offset:end] = marker[:end - offset]
+                self.set_lcd_raw(2, frame_buf)
                 frames += 1
-                time.sleep(rate)
+                # Sleep to an absolute deadline so send time doesn't add drift
+                deadline += rate
+                time.sleep(max(0.0, deadline - time.perf_counter()))
 
-            actual_fps = frames / (time.time() - start_time)
+            actual_fps = frames / (time.perf_counter() - start_time)
             print(f"  Achieved: {actual_fps:.1f} fps\n")
 
         self.animation_running = False
@@ -347,34 +493,40 @@ class LCDExplorer:
 
         current_block_idx = 0  # Start with STX (solid block)
         block_char = block_candidates[current_block_idx][0]
-        space_char = 32  # Space for empty part
+        # Full-width bars; each frame just slices them to the current level
+        block_bar = bytes([block_char]) * 60
+        space_bar = b' ' * 60  # Space for empty part
 
         frame = 0
+        deadline = time.perf_counter()
         while self.animation_running:
             block_name = block_candidates[current_block_idx][1]
-            self.set_lcd_line(1, f"VU Meter - Block: {block_name}".ljust(68))
 
             # Simulate stereo levels (0-60 to leave room for labels)
-            level_l = int(abs(math.sin(frame * 0.1)) * 60)
-            level_r = int(abs(math.cos(frame * 0.15)) * 60)
-
-            # Build meter bars using raw bytes
-            meter_l = [ord('L'), ord(':')] + [block_char] * level_l + [space_char] * (60 - level_l) + [ord(' ')] * 6
-            meter_r = [ord('R'), ord(':')] + [block_char] * level_r + [space_char] * (60 - level_r) + [ord(' ')] * 6
+            level_l = int(abs(_SIN_TABLE[(frame * 2) & _TRIG_MASK]) * 60)
+            level_r = int(abs(_COS_TABLE[(frame * 3) & _TRIG_MASK]) * 60)
 
-            self.set_lcd_raw(2, meter_l)
-            self.set_lcd_raw(3, meter_r)
+            # Build meter bars using raw bytes (set_lcd_raw pads the last 6 chars)
+            meter_l = b'L:' + block_bar[:level_l] + space_bar[level_l:]
+            meter_r = b'R:' + block_bar[:level_r] + space_bar[level_r:]
 
-            # Show values and instructions
-            self.set_lcd_line(4, f"L:{level_l:2d} R:{level_r:2d}  [1-9]=chars [n/p]=next/prev [q]=quit")
+            # Send title, both meters and values/instructions as one burst
+            self.send_sysex_batch([
+                self.lcd_line_data(1, f"VU Meter - Block: {block_name}".ljust(68)),
+                self.lcd_raw_data(2, meter_l),
+                self.lcd_raw_data(3, meter_r),
+                self.lcd_line_data(4, f"L:{level_l:2d} R:{level_r:2d}  [1-9]=chars [n/p]=next/prev [q]=quit"),
+            ])
 
             frame += 1
-            time.sleep(0.05)
+            deadline += 0.05
+            time.sleep(max(0.0, deadline - time.perf_counter()))
 
             # Auto-cycle through blocks every 3 seconds
             if frame % 60 == 0:
                 current_block_idx = (current_block_idx + 1) % len(block_candidates)
                 block_char = block_candidates[current_block_idx][0]
+                block_bar = bytes([block_char]) * 60
                 print(f"Trying: {block_candidates[current_block_idx][1]}")
 
             if frame > 600:  # Auto-stop after ~30 seconds
@@ -389,12 +541,16 @@ class LCDExplorer:
 
         text = "    Welcome to Push 1 LCD Explorer! This text scrolls across the display. The Push 1 has a 4-line character LCD with 68 characters per line, divided into 4 segments of 17 characters each.    "
 
+        # Encode once and scroll zero-copy windows over the bytes
+        text_view = memoryview(text.encode('ascii'))
+        caption = " " * 20 + "SCROLLING TEXT DEMO" + " " * 29
+
         self.set_lcd_line(1, "=" * 68)
         self.set_lcd_line(4, "=" * 68)
 
-        for i in range(len(text) - 68 + 1):
-            self.set_lcd_line(2, text[i:i+68])
-            self.set_lcd_line(3, " " * 20 + "SCROLLING TEXT DEMO" + " " * 29)
+        for i in range(len(text_view) - 68 + 1):
+            self.set_lcd_raw(2, text_view[i:i+68])
+            self.set_lcd_line(3, caption)
             time.sleep(0.08)
 
         print("Scrolling complete")
@@ -403,24 +559,10 @@ class LCDExplorer:
         """Demo grid/pattern display using characters."""
         print("\nGrid Pattern Demo")
 
-        patterns = [
-            # Checkerboard
-            ("Checkerboard", lambda x, y: "#" if (x + y) % 2 == 0 else " "),
-            # Diagonal
-            ("Diagonal Lines", lambda x, y: "/" if (x + y) % 4 == 0 else " "),
-            # Dots
-            ("Dot Grid", lambda x, y: "." if x % 4 == 0 and y % 2 == 0 else " "),
-            # Blocks
-            ("Block Pattern", lambda x, y: "#" if x % 8 < 4 else "-"),
-        ]
-
-        for name, pattern_func in patterns:
+        for name, rows in _PATTERN_ROWS:
             self.set_lcd_line(1, f"Pattern: {name}".center(68))
 
-            for line in range(2, 5):
-                row = ""
-                for x in range(68):
-                    row += pattern_func(x, line - 2)
+            for line, row in enumerate(rows, start=2):
                 self.set_lcd_line(line, row)
 
             time.sleep(2)
@@ -434,14 +576,18 @@ class LCDExplorer:
         self.set_lcd_line(1, "Progress Bar Demo".center(68))
         self.set_lcd_line(4, "")
 
+        # Calculate bar width (using 60 chars for the bar)
+        bar_width = 60
+        fill = b'=' * bar_width
+        empty = b' ' * bar_width
+
         for progress in range(101):
-            # Calculate bar width (using 60 chars for the bar)
-            bar_width = 60
             filled = int(progress / 100 * bar_width)
 
-            bar = "[" + "=" * filled + ">" + " " * (bar_width - filled - 1) + "]"
+            bar = b'[' + fill[:filled] + b'>' + empty[filled + 1:] + b']'
 
-            self.set_lcd_line(2, bar.center(68))
+            # Center on the line (set_lcd_raw pads the right side)
+            self.set_lcd_raw(2, empty[:(68 - len(bar)) // 2] + bar)
             self.set_lcd_line(3, f"{progress}% complete".center(68))
 
             time.sleep(0.03)
@@ -459,6 +605,7 @@ class LCDExplorer:
 
         self.set_lcd_line(1, "Waveform Visualization".center(68))
 
+        deadline = time.perf_counter()
         for frame in range(200):
             wave_line = ""
             for x in range(68):
@@ -467,8 +614,6 @@ class LCDExplorer:
                 char_idx = int(value * (len(wave_chars) - 1))
                 wave_line += wave_chars[char_idx]
 
-            self.set_lcd_line(2, wave_line)
-
             # Second wave (different frequency)
             wave_line2 = ""
             for x in range(68):
@@ -476,11 +621,14 @@ class LCDExplorer:
                 char_idx = int(value * (len(wave_chars) - 1))
                 wave_line2 += wave_chars[char_idx]
 
-            self.set_lcd_line(3, wave_line2)
-
-            self.set_lcd_line(4, f"Frame: {frame:3d}".center(68))
+            self.send_sysex_batch([
+                self.lcd_line_data(2, wave_line),
+                self.lcd_line_data(3, wave_line2),
+                self.lcd_line_data(4, f"Frame: {frame:3d}".center(68)),
+            ])
 
-            time.sleep(0.05)
+            deadline += 0.05
+            time.sleep(max(0.0, deadline - time.perf_counter()))
 
         print("Waveform demo complete")
 
@@ -497,10 +645,23 @@ class LCDExplorer:
         PIPE = ord('|')
         DASH = ord('-')
 
-        def make_runner(frame, width=17):
+        BLANK = bytes([SPACE]) * CHARS_PER_SEGMENT
+        FLATLINE = bytes([DASH]) * CHARS_PER_SEGMENT
+
+        # Preallocated frame: each animation draws in place into its own
+        # 17-char segment rows, which are then copied into the LCD lines
+        ball_lines = [bytearray(BLANK) for _ in range(4)]
+        pong_lines = [bytearray(BLANK) for _ in range(4)]
+        rain_lines = [bytearray(BLANK) for _ in range(4)]
+        runner = bytearray(BLANK)
+        heartbeat = bytearray(FLATLINE)
+        line2_raw = bytearray(b' ' * CHARS_PER_LINE)
+        line3_raw = bytearray(b' ' * CHARS_PER_LINE)
+
+        def make_runner(frame, line, width=17):
             """Simple running figure that moves across segment."""
             pos = frame % (width - 3)
-            line = [SPACE] * width
+            line[:] = BLANK
             # Simple stick figure: o/\ or o|
             if frame % 4 < 2:
                 # Running pose 1
@@ -514,37 +675,34 @@ class LCDExplorer:
                     line[pos] = ord('o')
                 if pos + 1 < width:
                     line[pos + 1] = ord('\\')
-            return line
 
-        def make_bouncing_ball(frame, width=17, height=4):
-            """Ball bouncing - returns 4 lines for the segment column."""
+        def make_bouncing_ball(frame, lines, width=17, height=4):
+            """Ball bouncing - draws 4 lines for the segment column."""
             # Ball position oscillates
-            x = int((math.sin(frame * 0.15) + 1) * (width - 2) / 2)
-            y = int((math.sin(frame * 0.2) + 1) * (height - 1) / 2)
+            x = int((_SIN_TABLE[(frame * 3) & _TRIG_MASK] + 1) * (width - 2) / 2)
+            y = int((_SIN_TABLE[(frame * 4) & _TRIG_MASK] + 1) * (height - 1) / 2)
 
-            lines = []
             for row in range(height):
-                line = [SPACE] * width
+                line = lines[row]
+                line[:] = BLANK
                 if row == y:
                     line[x] = BLOCK
                     # Add shadow/trail
                     if x > 0:
                         line[x - 1] = DOT
-                lines.append(line)
-            return lines
 
-        def make_pong(frame, width=17):
+        def make_pong(frame, lines, width=17):
             """Simple pong - ball bounces, paddle follows."""
             # Ball position
-            ball_x = int((math.sin(frame * 0.1) + 1) * (width - 4) / 2) + 1
-            ball_y = int((math.sin(frame * 0.15) + 1) * 2)  # 0, 1, or 2
+            ball_x = int((_SIN_TABLE[(frame * 2) & _TRIG_MASK] + 1) * (width - 4) / 2) + 1
+            ball_y = int((_SIN_TABLE[(frame * 3) & _TRIG_MASK] + 1) * 2)  # 0, 1, or 2
 
             # Paddle follows ball roughly
             paddle_y = min(2, max(0, ball_y))
 
-            lines = []
             for row in range(4):
-                line = [SPACE] * width
+                line = lines[row]
+                line[:] = BLANK
                 # Left paddle (always at x=0)
                 if row in [paddle_y, paddle_y + 1]:
                     line[0] = BLOCK
@@ -554,14 +712,12 @@ class LCDExplorer:
                 # Right paddle
                 if row in [paddle_y, paddle_y + 1]:
                     line[width - 1] = BLOCK
-                lines.append(line)
-            return lines
 
-        def make_rain(frame, width=17):
+        def make_rain(frame, lines, width=17):
             """Falling rain drops."""
-            lines = []
             for row in range(4):
-                line = [SPACE] * width
+                line = lines[row]
+                line[:] = BLANK
                 for col in range(width):
                     # Each column has rain at different phases
                     drop_phase = (frame + col * 3 + row * 7) % 12
@@ -569,12 +725,10 @@ class LCDExplorer:
                         line[col] = PIPE
                     elif drop_phase < 2:
                         line[col] = DOT
-                lines.append(line)
-            return lines
 
-        def make_heartbeat(frame, width=17):
+        def make_heartbeat(frame, line, width=17):
             """Simple heartbeat/pulse line."""
-            line = [DASH] * width
+            line[:] = FLATLINE
             # Pulse moves across
             pulse_pos = frame % width
             if pulse_pos < width:
@@ -583,7 +737,6 @@ class LCDExplorer:
                 line[pulse_pos - 1] = ord('/')
             if pulse_pos < width - 1:
                 line[pulse_pos + 1] = ord('\\')
-            return line
 
         # Title line
         self.set_lcd_segments_centered(1, "GAME & WATCH", "Push 1 LCD", "4 Animations", "Press pad=exit")
@@ -603,29 +756,37 @@ class LCDExplorer:
                 break
 
             # Segment 0: Bouncing ball (uses all 4 lines worth but we show line 2)
-            ball_lines = make_bouncing_ball(frame)
+            make_bouncing_ball(frame, ball_lines)
 
             # Segment 1: Pong game
-            pong_lines = make_pong(frame)
+            make_pong(frame, pong_lines)
 
             # Segment 2: Rain
-            rain_lines = make_rain(frame)
+            make_rain(frame, rain_lines)
 
             # Segment 3: Runner on line 3, heartbeat on line 2
-            runner = make_runner(frame)
-            heartbeat = make_heartbeat(frame)
+            make_runner(frame, runner)
+            make_heartbeat(frame, heartbeat)
 
             # Compose each line from 4 segments
             # Line 2: ball[1], pong[1], rain[1], heartbeat
-            line2_raw = ball_lines[1] + pong_lines[1] + rain_lines[1] + heartbeat[:11]
-            self.set_lcd_raw(2, line2_raw)
+            line2_raw[0:17] = ball_lines[1]
+            line2_raw[17:34] = pong_lines[1]
+            line2_raw[34:51] = rain_lines[1]
+            line2_raw[51:62] = heartbeat[:11]
 
             # Line 3: ball[2], pong[2], rain[2], runner
-            line3_raw = ball_lines[2] + pong_lines[2] + rain_lines[2] + runner[:11]
-            self.set_lcd_raw(3, line3_raw)
-
-            # Line 4: Labels
-            self.set_lcd_segments(4, "  Bounce", "   Pong", "   Rain", " Run+Pulse")
+            line3_raw[0:17] = ball_lines[2]
+            line3_raw[17:34] = pong_lines[2]
+            line3_raw[34:51] = rain_lines[2]
+            line3_raw[51:62] = runner[:11]
+
+            # Flush both animation lines plus the labels (line 4) together
+            self.send_sysex_batch([
+                self.lcd_raw_data(2, line2_raw),
+                self.lcd_raw_data(3, line3_raw),
+                self.lcd_segments_data(4, "  Bounce", "   Pong", "   Rain", " Run+Pulse"),
+            ])
 
             frame += 1
             time.sleep(0.08)
@@ -643,36 +804,51 @@ class LCDExplorer:
         self.set_lcd_line(3, "12345678901234567123456789012345671234567890123456712345678901234567")
         self.set_lcd_line(4, "       ^GAP^            ^GAP^            ^GAP^                   ")
 
-    def init_hardware_ui(self):
-        """Initialize hardware UI - light up demo selection buttons."""
+    def _build_ui_init_msgs(self):
+        """Build the LED messages that light up the demo selection UI."""
+        msgs = []
+
         # Light up lower row buttons (CC 20-27) for 8 demos
         demo_buttons = [20, 21, 22, 23, 24, 25, 26, 27]
         colors = [COLORS['red'], COLORS['orange'], COLORS['yellow'], COLORS['green'],
                   COLORS['cyan'], COLORS['blue'], COLORS['purple'], COLORS['pink']]
 
         for cc in demo_buttons:
-            self.set_button_led(cc, 4)  # Bright
+            msgs.append(mido.Message('control_change', control=cc, value=4))  # Bright
 
         # Light navigation buttons dimly
         for cc in [44, 45, 46, 47]:  # Left, Right, Up, Down
-            self.set_button_led(cc, 1)  # Dim
+            msgs.append(mido.Message('control_change', control=cc, value=1))  # Dim
 
         # Light bottom row pads (1-8) with demo colors
         for i in range(8):
             note = PAD_START + i  # Notes 36-43 (bottom row)
-            self.set_pad_color(note, colors[i])
+            msgs.append(mido.Message('note_on', note=note, velocity=colors[i]))
 
         # Light second row pad 1 (note 44) for Game & Watch demo - white
-        self.set_pad_color(PAD_START + 8, COLORS['white'])
+        msgs.append(mido.Message('note_on', note=PAD_START + 8, velocity=COLORS['white']))
+
+        return msgs
+
+    def init_hardware_ui(self):
+        """Initialize hardware UI - light up demo selection buttons."""
+        # Push 1 has no bulk LED SysEx, so replay the prebuilt messages
+        if self.push_out:
+            for msg in self._ui_init_msgs:
+                self.push_out.send(msg)
 
-    def show_menu(self):
+    def show_menu_lcd(self):
         """Display the main menu on the LCD using segment-aware formatting."""
         # Use segments to keep labels clean within boundaries
-        self.set_lcd_segments_centered(1, "LCD Explorer", "Push 1", "Hardware+KB", "Controls")
-        self.set_lcd_segments(2, "Pad1: Chars", "Pad2: Special", "Pad3: VU Meter", "Pad4: Animation")
-        self.set_lcd_segments(3, "Pad5: Scroll", "Pad6: Grid", "Pad7: Progress", "Pad8: Waveform")
-        self.set_lcd_segments(4, "Row2 Pad1: G&W", "Note: Layout", "Session: Menu", "KB: g=G&W q=Quit")
-
+        self.send_sysex_batch([
+            self.lcd_segments_centered_data(1, "LCD Explorer", "Push 1", "Hardware+KB", "Controls"),
+            self.lcd_segments_data(2, "Pad1: Chars", "Pad2: Special", "Pad3: VU Meter", "Pad4: Animation"),
+            self.lcd_segments_data(3, "Pad5: Scroll", "Pad6: Grid", "Pad7: Progress", "Pad8: Waveform"),
+            self.lcd_segments_data(4, "Row2 Pad1: G&W", "Note: Layout", "Session: Menu", "KB: g=G&W q=Quit"),
+        ])
+
+    def print_help(self):
+        """Print the console help (startup and 'h' only, not after every demo)."""
         print("\n" + "=" * 60)
         print("Push 1 LCD Explorer - Hardware + Keyboard Control")
         print("=" * 60)
@@ -690,7 +866,7 @@ class LCDExplorer:
         print("    Pad 9 (white)  - GAME & WATCH style demo!")
         print("\n  Note button    - Show segment layout")
         print("  Session button - Return to menu")
-        print("\nKEYBOARD: c x b a s g p w m l r q (m=Game&Watch)")
+        print("\nKEYBOARD: c x b a s g p w m l r h q (m=Game&Watch, h=help)")
         print("=" * 60)
 
     def handle_midi_input(self, msg):
@@ -711,7 +887,7 @@ class LCDExplorer:
                 ]
                 print(f"\n[Pad {pad_num + 1} pressed]")
                 demos[pad_num]()
-                self.show_menu()
+                self.show_menu_lcd()
                 self.init_hardware_ui()
                 return True
 
@@ -719,7 +895,7 @@ class LCDExplorer:
             elif msg.note == PAD_START + 8:
                 print("\n[Pad 9 pressed - Game & Watch demo]")
                 self.game_watch_demo()
-                self.show_menu()
+                self.show_menu_lcd()
                 self.init_hardware_ui()
                 return True
 
@@ -731,7 +907,7 @@ class LCDExplorer:
                 return True
             elif msg.control == BUTTONS['session']:  # Session button
                 print("\n[Session button - Menu]")
-                self.show_menu()
+                self.show_menu_lcd()
                 self.init_hardware_ui()
                 return True
             elif msg.control == BUTTONS['left']:
@@ -750,7 +926,8 @@ class LCDExplorer:
 
         self.set_user_mode()
         self.init_hardware_ui()
-        self.show_menu()
+        self.show_menu_lcd()
+        self.print_help()
 
         self.running = True
         print("\nReady! Use Push pads or keyboard commands...")
@@ -770,47 +947,49 @@ class LCDExplorer:
                         self.running = False
                     elif cmd == 'c':
                         self.cycle_character_set()
-                        self.show_menu()
+                        self.show_menu_lcd()
                         self.init_hardware_ui()
                     elif cmd == 'x':
                         self.explore_special_chars()
-                        self.show_menu()
+                        self.show_menu_lcd()
                         self.init_hardware_ui()
                     elif cmd == 'a':
                         self.animation_speed_test()
-                        self.show_menu()
+                        self.show_menu_lcd()
                         self.init_hardware_ui()
                     elif cmd == 'b':
                         self.vu_meter_demo()
-                        self.show_menu()
+                        self.show_menu_lcd()
                         self.init_hardware_ui()
                     elif cmd == 's':
                         self.scrolling_text_demo()
-                        self.show_menu()
+                        self.show_menu_lcd()
                         self.init_hardware_ui()
                     elif cmd == 'g':
                         self.grid_pattern_demo()
-                        self.show_menu()
+                        self.show_menu_lcd()
                         self.init_hardware_ui()
                     elif cmd == 'p':
                         self.progress_bar_demo()
-                        self.show_menu()
+                        self.show_menu_lcd()
                         self.init_hardware_ui()
                     elif cmd == 'w':
                         self.waveform_demo()
-                        self.show_menu()
+                        self.show_menu_lcd()
                         self.init_hardware_ui()
                     elif cmd == 'm':
                         self.game_watch_demo()
-                        self.show_menu()
+                        self.show_menu_lcd()
                         self.init_hardware_ui()
                     elif cmd == 'l':
                         self.show_segment_layout()
                     elif cmd == 'r':
-                        self.show_menu()
+                        self.show_menu_lcd()
                         self.init_hardware_ui()
+                    elif cmd == 'h':
+                        self.print_help()
                     elif cmd:
-                        print("Unknown. Try: c x b a s g p w m l r q (or use Push pads)")
+                        print("Unknown. Try: c x b a s g p w m l r h q (or use Push pads)")
 
             except KeyboardInterrupt:
                 print("\nInterrupted")
@@ -22,6 +22,19 @@ LCD_LINES = {
     4: 0x1B,
 }
 
+# Per-line sysex prefix: line address, 0x00, length 0x45 (offset + 68 chars), offset 0
+LINE_PREFIX = {line: bytes([addr, 0x00, 0x45, 0x00]) for line, addr in LCD_LINES.items()}
+
+# Test patterns (68 chars: 0         1         2         3         4         5         6
+#                          0123456789012345678901234567890123456789012345678901234567890123456789)
+RULER_TENS = "0       8       16      24      32      40      48      56      64  "
+RULER_ONES = "01234567890123456789012345678901234567890123456789012345678901234567"
+RULER_BARS = "|" * 68
+
+SEG8 = "".join(c * 8 for c in "ABCDEFGH")    # 8 segments of 8 chars (64)
+SEG9 = "".join(c * 9 for c in "ABCDEFGH")    # 8 segments of 9 chars (72)
+SEG17 = "".join(c * 17 for c in "ABCD")      # 4 segments of 17 chars (68)
+
 def find_push():
     """Find Push User Port."""
     print("Available MIDI outputs:")
@@ -43,11 +56,9 @@ def send_sysex(port, data):
 
 def set_lcd_line(port, line_num, text):
     """Set a full 68-character line."""
-    text = text.ljust(68)[:68]
-    line_addr = LCD_LINES.get(line_num, LCD_LINES[1])
-    data = [line_addr, 0x00, 0x45, 0x00]
-    data.extend([ord(c) for c in text])
-    send_sysex(port, data)
+    prefix = LINE_PREFIX.get(line_num, LINE_PREFIX[1])
+    payload = prefix + text.ljust(68)[:68].encode('ascii', 'replace')
+    send_sysex(port, list(payload))
 
 def clear_lcd(port):
     for line in range(1, 5):
@@ -76,15 +87,10 @@ def main():
         print("Press Enter...")
         input()
 
-        # Create a ruler showing position numbers
-        # 68 chars: 0         1         2         3         4         5         6
-        #           0123456789012345678901234567890123456789012345678901234567890123456789
-        ruler1 = "0       8       16      24      32      40      48      56      64  "
-        ruler2 = "01234567890123456789012345678901234567890123456789012345678901234567"
-
-        set_lcd_line(port, 1, ruler1[:68])
-        set_lcd_line(port, 2, ruler2[:68])
-        set_lcd_line(port, 3, "||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||||"[:68])
+        # Ruler showing position numbers
+        set_lcd_line(port, 1, RULER_TENS)
+        set_lcd_line(port, 2, RULER_ONES)
+        set_lcd_line(port, 3, RULER_BARS)
         set_lcd_line(port, 4, "Look for gaps in the lines above to find segment boundaries")
 
         print("Look at the display - where do you see gaps in the ruler?")
@@ -98,16 +104,13 @@ def main():
         # 68 / 8 = 8.5, so maybe 9+8+9+8+9+8+9+8 = 68? or 8+9 alternating?
 
         # Pattern with clear segment markers
-        seg8 = "AAAAAAAA" + "BBBBBBBB" + "CCCCCCCC" + "DDDDDDDD" + "EEEEEEEE" + "FFFFFFFF" + "GGGGGGGG" + "HHHHHHHH"
-        set_lcd_line(port, 1, seg8[:68] + "    ")  # 64 chars for 8x8
+        set_lcd_line(port, 1, SEG8)   # 64 chars for 8x8, padded to 68
 
         # Try 9-char segments
-        seg9 = "AAAAAAAAA" + "BBBBBBBBB" + "CCCCCCCCC" + "DDDDDDDDD" + "EEEEEEEEE" + "FFFFFFFFF" + "GGGGGGGGG" + "HHHHHHHHH"
-        set_lcd_line(port, 2, seg9[:68])  # 72 chars truncated to 68
+        set_lcd_line(port, 2, SEG9)   # 72 chars truncated to 68
 
         # Try 4 segments of 17 chars
-        seg17 = "AAAAAAAAAAAAAAAAA" + "BBBBBBBBBBBBBBBBB" + "CCCCCCCCCCCCCCCCC" + "DDDDDDDDDDDDDDDDD"
-        set_lcd_line(port, 3, seg17[:68])
+        set_lcd_line(port, 3, SEG17)
 
         set_lcd_line(port, 4, "8x8=64 chars | 8x9=72 chars | 4x17=68 chars")
 
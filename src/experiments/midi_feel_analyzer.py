@@ -13,6 +13,10 @@ Usage:
     python3 midi_feel_analyzer.py <midi_file>
     python3 midi_feel_analyzer.py <directory>  # Analyze all MIDI files
 
+Options:
+    --json   Export the analysis as JSON
+    --cache  Cache extracted notes in .feel_cache/ to skip MIDI parsing on re-runs
+
 Output:
     Console summary + optional JSON export
 
@@ -23,8 +27,12 @@ Requirements:
 import sys
 import os
 import json
+import hashlib
+import itertools
 from pathlib import Path
-from collections import defaultdict, Counter
+from functools import partial
+from multiprocessing import Pool
+from collections import Counter
 from dataclasses import dataclass, asdict
 from typing import List, Dict, Tuple, Optional
 
@@ -42,25 +50,46 @@ except ImportError:
 # Data Extraction
 # ============================================================================
 
+# Extracted notes cache (keyed by absolute path + mtime)
+CACHE_DIR = Path('.feel_cache')
+
 def extract_notes(midi: pretty_midi.PrettyMIDI) -> pd.DataFrame:
     """Extract all notes from MIDI file into a DataFrame."""
-    events = []
-
-    for i, instrument in enumerate(midi.instruments):
-        if instrument.is_drum:
-            continue  # Skip drums for now
-
-        for note in instrument.notes:
-            events.append({
-                'instrument': i,
-                'pitch': note.pitch,
-                'start': note.start,
-                'end': note.end,
-                'duration': note.end - note.start,
-                'velocity': note.velocity,
-            })
-
-    df = pd.DataFrame(events)
+    instruments = [(i, instrument) for i, instrument in enumerate(midi.instruments)
+                   if not instrument.is_drum]  # Skip drums for now
+    total = sum(len(instrument.notes) for _, instrument in instruments)
+
+    # Fill preallocated columns instead of building a dict per note
+    instrument_col = np.empty(total, dtype=np.int16)
+    pitch = np.empty(total, dtype=np.int8)
+    start = np.empty(total, dtype=np.float64)
+    end = np.empty(total, dtype=np.float64)
+    velocity = np.empty(total, dtype=np.int8)
+
+    pos = 0
+    for i, instrument in instruments:
+        notes = instrument.notes
+        n = len(notes)
+        instrument_col[pos:pos + n] = i
+        pitch[pos:pos + n] = np.fromiter((note.pitch for note in notes), np.int8, n)
+        start[pos:pos + n] = np.fromiter((note.start for note in notes), np.float64, n)
+        end[pos:pos + n] = np.fromiter((note.end for note in notes), np.float64, n)
+        velocity[pos:pos + n] = np.fromiter((note.velocity for note in notes), np.int8, n)
+        pos += n
+
+    # Narrow dtypes keep the table small for the memory-bound analyses.
+    # MIDI values fit in int8, but times and durations stay float64: at
+    # float32 an on-beat note late in a piece can land a hair before the
+    # beat, and a tick-quantized 50 ms note can cross the grace-note
+    # threshold.
+    df = pd.DataFrame({
+        'instrument': instrument_col,
+        'pitch': pitch,
+        'start': start,
+        'end': end,
+        'duration': end - start,
+        'velocity': velocity,
+    })
     if len(df) == 0:
         return df
 
@@ -68,22 +97,78 @@ def extract_notes(midi: pretty_midi.PrettyMIDI) -> pd.DataFrame:
     return df
 
 
+def load_notes(midi_path: str, use_cache: bool = False) -> Optional[Tuple[pd.DataFrame, float, float]]:
+    """Load notes, tempo and duration of a MIDI file.
+
+    With use_cache, results are pickled to CACHE_DIR and reused while the
+    file is unchanged, skipping PrettyMIDI parsing entirely.
+    """
+    cache_path = None
+    if use_cache:
+        key = hashlib.sha1(os.path.abspath(midi_path).encode()).hexdigest()
+        cache_path = CACHE_DIR / f"{key}_{os.path.getmtime(midi_path)}.pkl"
+        if cache_path.exists():
+            try:
+                return pd.read_pickle(cache_path)
+            except Exception:
+                pass  # Unreadable cache entry - parse again below
+
+    try:
+        midi = pretty_midi.PrettyMIDI(midi_path)
+    except Exception as e:
+        print(f"Error loading {midi_path}: {e}")
+        return None
+
+    loaded = (extract_notes(midi), midi.estimate_tempo(), midi.get_end_time())
+
+    if cache_path is not None:
+        try:
+            CACHE_DIR.mkdir(exist_ok=True)
+            pd.to_pickle(loaded, cache_path)
+        except OSError as e:
+            print(f"Could not cache {midi_path}: {e}")
+
+    return loaded
+
+
 # ============================================================================
 # Timing Analysis
 # ============================================================================
 
+def annotate_df(df: pd.DataFrame, tempo: float, chord_threshold_ms: float = 50) -> pd.DataFrame:
+    """Add every derived per-note column in one pass, in place.
+
+    Adds beat, nearest_16th, timing_deviation_ms, beat_phase, is_downbeat
+    and chord_id to a start-sorted DataFrame owned by the caller (as
+    returned by extract_notes), so the analysis functions can read them
+    without copying the table again.
+    """
+    if len(df) == 0:
+        return df
+
+    calculate_timing_deviations(df, tempo)
+    df['beat_phase'] = df['beat'] % 1.0
+    df['is_downbeat'] = df['beat_phase'] < 0.1
+    return detect_chords(df, chord_threshold_ms)
+
+
 def calculate_timing_deviations(df: pd.DataFrame, tempo: float) -> pd.DataFrame:
-    """Calculate timing deviation from nearest 16th note grid."""
+    """Calculate timing deviation from nearest 16th note grid (in place)."""
     if len(df) == 0:
         return df
 
+    # Tempo is constant per file: divide the start times once and derive
+    # the 16th grid from the beat positions
     beat_duration = 60.0 / tempo
     grid_16th = beat_duration / 4  # 16th note duration
 
-    df = df.copy()
-    df['beat'] = df['start'] / beat_duration
-    df['nearest_16th'] = (df['start'] / grid_16th).round() * grid_16th
-    df['timing_deviation_ms'] = (df['start'] - df['nearest_16th']) * 1000
+    starts = df['start'].to_numpy()
+    beats = starts / beat_duration
+    nearest_16th = (beats * 4).round() * grid_16th
+
+    df['beat'] = beats
+    df['nearest_16th'] = nearest_16th
+    df['timing_deviation_ms'] = (starts - nearest_16th) * 1000
 
     return df
 
@@ -93,21 +178,22 @@ def analyze_swing(df: pd.DataFrame, tempo: float) -> Optional[float]:
     if len(df) < 10:
         return None
 
-    beat_duration = 60.0 / tempo
-    eighth = beat_duration / 2
-
     # Find notes on off-beats (should be around 0.5 beats after downbeat)
-    df = df.copy()
-    df['beat_phase'] = (df['start'] / beat_duration) % 1.0
+    if 'beat_phase' in df.columns:
+        beat_phase = df['beat_phase']
+    elif 'beat' in df.columns:
+        beat_phase = df['beat'] % 1.0
+    else:
+        beat_phase = (df['start'] / (60.0 / tempo)) % 1.0
 
     # Notes between 0.4 and 0.7 beat phase are potential off-beats
-    off_beats = df[(df['beat_phase'] > 0.4) & (df['beat_phase'] < 0.7)]
+    off_beats = beat_phase[(beat_phase > 0.4) & (beat_phase < 0.7)]
 
     if len(off_beats) < 5:
         return None
 
     # Average off-beat position
-    mean_phase = off_beats['beat_phase'].mean()
+    mean_phase = off_beats.mean()
 
     # Convert to swing ratio (0.5 = straight, 0.67 = triplet swing)
     swing_ratio = mean_phase / (1.0 - mean_phase) if mean_phase < 1.0 else 0.5
@@ -132,27 +218,27 @@ def analyze_velocity(df: pd.DataFrame) -> Dict:
         'max': int(df['velocity'].max()),
     }
 
-    # Bass/treble ratio (below/above middle C = 60)
-    bass_notes = df[df['pitch'] < 60]
-    treble_notes = df[df['pitch'] >= 60]
+    # Bass/treble ratio (below/above middle C = 60), from masks over the raw arrays
+    velocity = df['velocity'].to_numpy()
+    is_bass = df['pitch'].to_numpy() < 60
 
-    if len(bass_notes) > 0 and len(treble_notes) > 0:
-        bass_vel = bass_notes['velocity'].mean()
-        treble_vel = treble_notes['velocity'].mean()
+    if is_bass.any() and not is_bass.all():
+        bass_vel = velocity[is_bass].mean()
+        treble_vel = velocity[~is_bass].mean()
         stats['bass_treble_ratio'] = float(bass_vel / treble_vel) if treble_vel > 0 else 1.0
     else:
         stats['bass_treble_ratio'] = 1.0
 
     # Downbeat accent (requires beat info)
     if 'beat' in df.columns:
-        df = df.copy()
-        df['is_downbeat'] = (df['beat'] % 1.0) < 0.1
-        downbeats = df[df['is_downbeat']]
-        upbeats = df[~df['is_downbeat']]
+        if 'is_downbeat' in df.columns:
+            is_downbeat = df['is_downbeat'].to_numpy()
+        else:
+            is_downbeat = (df['beat'].to_numpy() % 1.0) < 0.1
 
-        if len(downbeats) > 0 and len(upbeats) > 0:
+        if is_downbeat.any() and not is_downbeat.all():
             stats['downbeat_accent'] = float(
-                downbeats['velocity'].mean() / upbeats['velocity'].mean()
+                velocity[is_downbeat].mean() / velocity[~is_downbeat].mean()
             )
         else:
             stats['downbeat_accent'] = 1.0
@@ -165,71 +251,87 @@ def analyze_velocity(df: pd.DataFrame) -> Dict:
 # ============================================================================
 
 def detect_chords(df: pd.DataFrame, threshold_ms: float = 50) -> pd.DataFrame:
-    """Group notes into chords based on timing proximity."""
+    """Group notes into chords based on timing proximity.
+
+    Adds chord_id in place when df is already sorted by start; otherwise
+    works on a sorted copy.
+    """
     if len(df) == 0:
         return df
 
-    df = df.copy()
-    df = df.sort_values('start').reset_index(drop=True)
-
-    chord_id = 0
-    chord_ids = []
-    last_start = -1.0
+    if not df['start'].is_monotonic_increasing:
+        df = df.sort_values('start').reset_index(drop=True)
 
-    for _, row in df.iterrows():
-        if (row['start'] - last_start) * 1000 > threshold_ms:
-            chord_id += 1
-        chord_ids.append(chord_id)
-        last_start = row['start']
+    # A new chord starts wherever the gap to the previous note exceeds the
+    # threshold; the first note always starts chord 1
+    starts = df['start'].to_numpy()
+    gap_ms = np.empty_like(starts)
+    gap_ms[0] = np.inf
+    gap_ms[1:] = np.diff(starts) * 1000
 
-    df['chord_id'] = chord_ids
+    df['chord_id'] = (gap_ms > threshold_ms).cumsum()
     return df
 
 
+# Chord roll directions ('unknown' when a performance has no chords)
+DIRECTION_CATS = pd.CategoricalDtype(['bottom_up', 'top_down', 'mixed', 'unknown'])
+
+
 def analyze_chord_feel(df: pd.DataFrame) -> Dict:
     """Extract chord spread and velocity patterns within chords."""
     if 'chord_id' not in df.columns or len(df) == 0:
         return {}
 
-    chord_groups = df.groupby('chord_id')
-
-    spreads = []
-    velocity_ranges = []
-    chord_sizes = []
-    directions = {'bottom_up': 0, 'top_down': 0, 'mixed': 0}
-
-    for _, chord in chord_groups:
-        if len(chord) < 2:
-            continue
-
-        chord_sizes.append(len(chord))
-
-        # Timing spread
-        spread = (chord['start'].max() - chord['start'].min()) * 1000
-        spreads.append(spread)
-
-        # Velocity range
-        vel_range = chord['velocity'].max() - chord['velocity'].min()
-        velocity_ranges.append(vel_range)
-
-        # Direction (bottom-up or top-down?)
-        chord_sorted = chord.sort_values('start')
-        pitches_in_order = chord_sorted['pitch'].tolist()
-
-        if len(pitches_in_order) >= 2:
-            # Check if pitches increase or decrease with time
-            pitch_diffs = [pitches_in_order[i+1] - pitches_in_order[i]
-                           for i in range(len(pitches_in_order)-1)]
-            if all(d >= 0 for d in pitch_diffs):
-                directions['bottom_up'] += 1
-            elif all(d <= 0 for d in pitch_diffs):
-                directions['top_down'] += 1
-            else:
-                directions['mixed'] += 1
-
-    if not spreads:
+    # Notes in (chord, time) order; detect_chords numbers chords in start
+    # order, so an already time-sorted df needs no reordering
+    chord_ids = df['chord_id'].to_numpy()
+    starts = df['start'].to_numpy()
+    if not (np.all(np.diff(chord_ids) >= 0) and np.all(np.diff(starts) >= 0)):
+        order = np.lexsort((starts, chord_ids))
+        chord_ids, starts = chord_ids[order], starts[order]
+    else:
+        order = slice(None)
+    pitches = df['pitch'].to_numpy()[order]
+    velocities = df['velocity'].to_numpy()[order]
+
+    # Each chord is a contiguous run; aggregate every run with reduceat
+    bounds = np.flatnonzero(np.r_[True, chord_ids[1:] != chord_ids[:-1]])
+    sizes = np.diff(np.r_[bounds, len(chord_ids)])
+    multi = sizes >= 2  # Single notes are not chords
+    if not multi.any():
         return {}
 
+    chord_sizes = sizes[multi]
+
+    # Timing spread
+    spreads = ((np.maximum.reduceat(starts, bounds)
+                - np.minimum.reduceat(starts, bounds)) * 1000)[multi]
+
+    # Velocity range
+    velocity_ranges = (np.maximum.reduceat(velocities, bounds)
+                       - np.minimum.reduceat(velocities, bounds))[multi]
+
+    # Direction (bottom-up or top-down?): check if pitches increase or
+    # decrease with time. A chord rises unless some step within it falls,
+    # and vice versa; steps across a chord boundary are ignored.
+    chord_of_note = np.repeat(np.arange(len(bounds)), sizes)
+    steps = np.diff(pitches.astype(np.int16))
+    same_chord = chord_ids[1:] == chord_ids[:-1]
+    later = chord_of_note[1:]
+    n_chords = len(bounds)
+    rising = (np.bincount(later[same_chord & (steps < 0)], minlength=n_chords) == 0)[multi]
+    falling = (np.bincount(later[same_chord & (steps > 0)], minlength=n_chords) == 0)[multi]
+
+    # Direction code per chord (0 bottom_up, 1 top_down, 2 mixed), tallied
+    # in a single bincount
+    codes = np.where(rising, 0, np.where(falling, 1, 2)).astype(np.int8)
+    counts = np.bincount(codes, minlength=3)
+    directions = {
+        'bottom_up': int(counts[0]),
+        'top_down': int(counts[1]),
+        'mixed': int(counts[2]),
+    }
+
     # Determine dominant direction
     total_dirs = sum(directions.values())
     if total_dirs > 0:
@@ -267,22 +369,21 @@ def detect_approach_notes(df: pd.DataFrame, threshold_ms: float = 80) -> List[in
         return []
 
     df_sorted = df.sort_values('start').reset_index(drop=True)
-    approach_indices = []
 
-    for i in range(len(df_sorted) - 1):
-        current = df_sorted.iloc[i]
-        next_note = df_sorted.iloc[i + 1]
+    # Compare every note with the next one using shifted arrays
+    starts = df_sorted['start'].to_numpy()
+    pitches = df_sorted['pitch'].to_numpy()
+    velocities = df_sorted['velocity'].to_numpy()
 
-        time_diff = (next_note['start'] - current['start']) * 1000
-        pitch_diff = abs(next_note['pitch'] - current['pitch'])
+    time_diff = (starts[1:] - starts[:-1]) * 1000
+    pitch_diff = np.abs(pitches[1:] - pitches[:-1])
 
-        # Criteria for approach note
-        if (time_diff < threshold_ms and
-            1 <= pitch_diff <= 2 and
-            current['velocity'] < next_note['velocity']):
-            approach_indices.append(i)
+    # Criteria for approach note
+    mask = ((time_diff < threshold_ms) &
+            (pitch_diff >= 1) & (pitch_diff <= 2) &
+            (velocities[:-1] < velocities[1:]))
 
-    return approach_indices
+    return np.nonzero(mask)[0].tolist()
 
 
 def detect_grace_notes(df: pd.DataFrame, max_duration_ms: float = 50) -> List[int]:
@@ -290,13 +391,8 @@ def detect_grace_notes(df: pd.DataFrame, max_duration_ms: float = 50) -> List[in
     if len(df) == 0:
         return []
 
-    grace_indices = []
-    for i, row in df.iterrows():
-        duration_ms = row['duration'] * 1000
-        if duration_ms < max_duration_ms:
-            grace_indices.append(i)
-
-    return grace_indices
+    mask = df['duration'].to_numpy() * 1000 < max_duration_ms
+    return df.index[mask].tolist()
 
 
 def detect_ghost_notes(df: pd.DataFrame, velocity_threshold: int = 50) -> List[int]:
@@ -304,12 +400,8 @@ def detect_ghost_notes(df: pd.DataFrame, velocity_threshold: int = 50) -> List[i
     if len(df) == 0:
         return []
 
-    ghost_indices = []
-    for i, row in df.iterrows():
-        if row['velocity'] < velocity_threshold:
-            ghost_indices.append(i)
-
-    return ghost_indices
+    mask = df['velocity'].to_numpy() < velocity_threshold
+    return df.index[mask].tolist()
 
 
 # ============================================================================
@@ -321,23 +413,33 @@ def analyze_inversions(df: pd.DataFrame) -> Dict:
     if 'chord_id' not in df.columns or len(df) == 0:
         return {}
 
-    inversion_counts = defaultdict(lambda: defaultdict(int))
+    # Notes ordered by chord, lowest pitch first, so each chord is a
+    # contiguous run that starts at its bass note
+    chord_ids = df['chord_id'].to_numpy()
+    all_pitches = df['pitch'].to_numpy()
+    order = np.lexsort((all_pitches, chord_ids))
+    chord_ids = chord_ids[order]
+    all_pitches = all_pitches[order].astype(np.int64)
 
-    for _, chord in df.groupby('chord_id'):
-        if len(chord) < 3:
-            continue
+    bounds = np.flatnonzero(np.r_[True, chord_ids[1:] != chord_ids[:-1]])
+    sizes = np.diff(np.r_[bounds, len(chord_ids)])
 
-        pitches = sorted(chord['pitch'].tolist())
-        bass_pc = pitches[0] % 12  # Pitch class of bass note
+    # Intervals from bass as a 12-bit mask per chord (bit n = n semitones up)
+    bass = np.repeat(all_pitches[bounds], sizes)
+    interval_bits = np.left_shift(1, (all_pitches - bass) % 12)
+    interval_masks = np.bitwise_or.reduceat(interval_bits, bounds)
 
-        # Get intervals from bass
-        intervals = [(p - pitches[0]) % 12 for p in pitches]
-        intervals = sorted(set(intervals))
+    # Identify chord type by interval pattern, for chords of 3+ notes
+    types = CHORD_TYPE_BY_MASK_ARRAY[interval_masks]
+    candidates = np.flatnonzero((sizes >= 3) & (types != 'unknown'))
 
-        # Identify chord type by interval pattern
-        chord_type = identify_chord_type(intervals)
-        if chord_type == 'unknown':
-            continue
+    chord_types = []
+    inversions = []
+
+    for c in candidates:
+        pitches = all_pitches[bounds[c]:bounds[c] + sizes[c]]
+        bass_pc = int(pitches[0]) % 12  # Pitch class of bass note
+        chord_type = types[c]
 
         # Identify root
         root_pc = identify_root(pitches, chord_type)
@@ -346,26 +448,24 @@ def analyze_inversions(df: pd.DataFrame) -> Dict:
 
         # Determine inversion
         bass_interval = (bass_pc - root_pc) % 12
-        if bass_interval == 0:
-            inversion = 'root'
-        elif bass_interval in [3, 4]:  # 3rd in bass
-            inversion = 'first'
-        elif bass_interval in [7]:  # 5th in bass
-            inversion = 'second'
-        elif bass_interval in [10, 11]:  # 7th in bass
-            inversion = 'third'
-        else:
-            inversion = 'other'
+        inversion = INVERSION_BY_BASS_INTERVAL.get(bass_interval, 'other')
+
+        chord_types.append(chord_type)
+        inversions.append(inversion)
 
-        inversion_counts[chord_type][inversion] += 1
+    # Count (chord type, inversion) pairs in one pass, then nest by type
+    counts = Counter(zip(chord_types, inversions))
+    by_type = {}
+    for (chord_type, inversion), count in counts.items():
+        by_type.setdefault(chord_type, {})[inversion] = count
 
     # Convert to percentages
     result = {}
-    for chord_type, inversions in inversion_counts.items():
-        total = sum(inversions.values())
+    for chord_type, type_counts in by_type.items():
+        total = sum(type_counts.values())
         result[chord_type] = {
             inv: round(count / total * 100, 1)
-            for inv, count in inversions.items()
+            for inv, count in type_counts.items()
         }
 
     return result
@@ -392,6 +492,23 @@ def identify_chord_type(intervals: List[int]) -> str:
     return 'unknown'
 
 
+# Chord type for every 12-bit interval mask, so classifying a chord is a
+# single lookup (same pattern priority as identify_chord_type)
+CHORD_TYPE_BY_MASK = [
+    identify_chord_type([i for i in range(12) if mask >> i & 1])
+    for mask in range(1 << 12)
+]
+CHORD_TYPE_BY_MASK_ARRAY = np.array(CHORD_TYPE_BY_MASK, dtype=object)
+
+# Inversion by interval of the bass above the root
+INVERSION_BY_BASS_INTERVAL = {
+    0: 'root',
+    3: 'first', 4: 'first',     # 3rd in bass
+    7: 'second',                # 5th in bass
+    10: 'third', 11: 'third',   # 7th in bass
+}
+
+
 def identify_root(pitches: List[int], chord_type: str) -> Optional[int]:
     """Identify the root pitch class of a chord."""
     # Simplified: assume root position for this analysis
@@ -448,33 +565,28 @@ class PerformanceProfile:
     inversion_preferences: Dict
 
 
-def analyze_midi_file(midi_path: str) -> Optional[PerformanceProfile]:
+def analyze_midi_file(midi_path: str, use_cache: bool = False) -> Optional[PerformanceProfile]:
     """Complete analysis of a MIDI file."""
-    try:
-        midi = pretty_midi.PrettyMIDI(midi_path)
-    except Exception as e:
-        print(f"Error loading {midi_path}: {e}")
+    # Extract notes plus basic info
+    loaded = load_notes(midi_path, use_cache)
+    if loaded is None:
         return None
+    df, tempo, duration = loaded
 
-    # Basic info
-    tempo = midi.estimate_tempo()
-    duration = midi.get_end_time()
-
-    # Extract notes
-    df = extract_notes(midi)
     if len(df) == 0:
         print(f"No notes found in {midi_path}")
         return None
 
+    # Derived timing/chord columns, added once to the freshly loaded df
+    df = annotate_df(df, tempo)
+
     # Timing analysis
-    df = calculate_timing_deviations(df, tempo)
     swing = analyze_swing(df, tempo)
 
     # Velocity analysis
     vel_stats = analyze_velocity(df)
 
     # Chord analysis
-    df = detect_chords(df)
     chord_feel = analyze_chord_feel(df)
 
     # Embellishment
@@ -566,7 +678,7 @@ def main():
 
     if os.path.isfile(path):
         # Single file
-        profile = analyze_midi_file(path)
+        profile = analyze_midi_file(path, use_cache='--cache' in sys.argv)
         if profile:
             print_profile(profile)
 
@@ -579,39 +691,48 @@ def main():
 
     elif os.path.isdir(path):
         # Directory - analyze all MIDI files
-        midi_files = list(Path(path).glob('**/*.mid')) + list(Path(path).glob('**/*.midi'))
-        print(f"Found {len(midi_files)} MIDI files in {path}\n")
+        # Walk the tree lazily so analysis starts before the scan finishes
+        midi_files = itertools.chain(Path(path).rglob('*.mid'), Path(path).rglob('*.midi'))
+        print(f"Analyzing MIDI files in {path}\n")
 
+        # Files are independent, so analyze them across all cores. imap keeps
+        # results in file order so the report and JSON stay deterministic.
+        analyze = partial(analyze_midi_file, use_cache='--cache' in sys.argv)
         profiles = []
-        for midi_file in midi_files:
-            profile = analyze_midi_file(str(midi_file))
-            if profile:
-                profiles.append(profile)
-                print(f"Analyzed: {profile.file_name} ({profile.total_notes} notes)")
+        found = 0
+        with Pool() as pool:
+            for profile in pool.imap(analyze, (str(m) for m in midi_files)):
+                found += 1
+                if profile:
+                    profiles.append(profile)
+                    print(f"Analyzed: {profile.file_name} ({profile.total_notes} notes)")
+        print(f"\nFound {found} MIDI files in {path}")
 
         if profiles:
             print("\n" + "=" * 60)
             print("AGGREGATE STATISTICS")
             print("=" * 60)
 
+            # One row per profile (shallow field copy, no asdict recursion)
+            df_profiles = pd.DataFrame([vars(p) for p in profiles])
+
             # Average timing
-            mean_dev = np.mean([p.timing_deviation_mean_ms for p in profiles])
+            mean_dev = df_profiles['timing_deviation_mean_ms'].mean()
             print(f"Avg timing deviation: {mean_dev:+.2f} ms")
 
             # Average chord spread
-            mean_spread = np.mean([p.chord_spread_mean_ms for p in profiles])
+            mean_spread = df_profiles['chord_spread_mean_ms'].mean()
             print(f"Avg chord spread: {mean_spread:.2f} ms")
 
             # Direction preference
-            directions = [p.chord_direction for p in profiles]
-            dir_counts = Counter(directions)
-            print(f"Direction preferences: {dict(dir_counts)}")
+            directions = df_profiles['chord_direction'].astype(DIRECTION_CATS)
+            dir_counts = directions.value_counts()
+            print(f"Direction preferences: {dir_counts[dir_counts > 0].to_dict()}")
 
             # Export all to JSON
             if '--json' in sys.argv:
                 json_path = os.path.join(path, 'analysis_summary.json')
-                with open(json_path, 'w') as f:
-                    json.dump([asdict(p) for p in profiles], f, indent=2)
+                df_profiles.to_json(json_path, orient='records', indent=2)
                 print(f"\nExported to: {json_path}")
 
     else:
@@ -14,14 +14,25 @@ Run: python3 src/experiments/piano_roll_display.py
 """
 
 import mido
+import os
 import time
 import sys
 import select
 import random
+import queue
+
+# Push 1 protocol helpers live in the open_push package under src/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from open_push.core.hardware import raw_sender
 
 # Push 1 SysEx
 SYSEX_HEADER = [0x47, 0x7F, 0x15]
+SYSEX_START = bytes([0xF0] + SYSEX_HEADER)  # Raw message prefix (rtmidi path)
 LCD_LINES = {1: 0x18, 2: 0x19, 3: 0x1A, 4: 0x1B}
+LINE_TEXT = slice(8, 76)  # Text bytes within a raw LCD line frame
+
+FRAME_INTERVAL = 0.02  # Longest wait between redraws (~50fps)
 
 # Characters
 BLOCK = chr(5)      # Note on (0x05)
@@ -29,6 +40,27 @@ EMPTY = ' '         # Empty step - no note
 BAR = '|'           # Bar marker (between bars)
 PLAYHEAD = '>'      # Playhead position
 
+# Same characters as LCD bytes, for drawing straight into bytearrays
+BLOCK_ORD = ord(BLOCK)
+EMPTY_ORD = ord(EMPTY)
+BAR_ORD = ord(BAR)
+PLAY_ORD = ord(PLAYHEAD)
+EMPTY_CELL = bytes([EMPTY_ORD])
+
+# Maps a grid cell (velocity, 0 = no note) to its LCD byte
+CELL_TABLE = EMPTY_CELL + bytes([BLOCK_ORD]) * 255
+
+# LCD line layout: 4 segments of 16 step columns, each followed by a bar
+SEGMENT_SPANS = ((0, 16), (17, 33), (34, 50), (51, 67))
+FRAME_LINE = (EMPTY_CELL * 16 + bytes([BAR_ORD])) * 4
+
+# Render modes: (grid row shown on each LCD line top to bottom, pitch labels)
+RENDER_MODES = {
+    'drum': ((0, 1, 2, 3), False),      # Lanes in order: kick, snare, hihat, perc
+    'piano': ((3, 2, 1, 0), False),     # Higher pitches on top
+    'labeled': ((3, 2, 1, 0), True),
+}
+
 # Button CCs
 BUTTONS = {
     'up': 46,
@@ -43,8 +75,13 @@ BUTTONS = {
 # Note names for display
 NOTE_NAMES = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
 
+# Name of every MIDI note, e.g. NOTE_NAME_TABLE[60] == 'C4'
+NOTE_NAME_TABLE = tuple(f"{NOTE_NAMES[n % 12]}{(n // 12) - 1}" for n in range(128))
+
 def get_note_name(midi_note):
     """Convert MIDI note to name like C4, D#5"""
+    if 0 <= midi_note < 128:
+        return NOTE_NAME_TABLE[midi_note]
     octave = (midi_note // 12) - 1
     note = NOTE_NAMES[midi_note % 12]
     return f"{note}{octave}"
@@ -54,6 +91,9 @@ class PianoRollDisplay:
     def __init__(self):
         self.push_in = None
         self.push_out = None
+        self._raw_send = None  # rtmidi send_message, set by connect()
+        self._midi_q = queue.Queue()  # Push input, filled by the reader callback
+        self._wake_r, self._wake_w = os.pipe()  # Reader pokes the main loop's select
         self.running = True
 
         # Sequencer state
@@ -61,18 +101,32 @@ class PianoRollDisplay:
         self.rows = 12   # One octave visible range (scrollable)
         self.base_note = 60  # C4 - bottom visible note
 
-        # Pattern storage: dict of {(row, step): velocity}
-        self.pattern = {}
+        # Pattern storage: one row of step velocities per note (0 = off)
+        self.grid = [bytearray(self.steps) for _ in range(128)]
 
         # Playhead
         self.playhead_pos = 0
         self.playing = False
-        self.last_step_time = time.time()
         self.step_duration = 0.125  # 16th notes at 120 BPM
+        self._step_ns = int(self.step_duration * 1_000_000_000)
+        self._start_ns = None  # Monotonic time of step 0 while playing
 
         # View offset
         self.view_offset_x = 0  # Horizontal scroll (in steps)
 
+        # Frame buffers the renderers draw into (bars stay in place)
+        self._frame = [bytearray(FRAME_LINE) for _ in range(4)]
+
+        # Last text sent per LCD line, so unchanged lines aren't resent
+        self._last_lines = [None] * 4  # bytes
+
+        # Complete F0 ... F7 sysex frame per LCD line; set_lcd_line only
+        # overwrites the 68 text bytes in place
+        self._line_frames = [
+            bytearray(SYSEX_START + bytes([addr, 0x00, 0x45, 0x00]) + b' ' * 68 + b'\xF7')
+            for addr in LCD_LINES.values()
+        ]
+
         # Initialize with a demo pattern
         self._init_demo_pattern()
 
@@ -83,21 +137,21 @@ class PianoRollDisplay:
 
         # Kick on 1 and 3
         for bar in range(4):
-            self.pattern[(0, bar * 16 + 0)] = 127   # Beat 1
-            self.pattern[(0, bar * 16 + 8)] = 100   # Beat 3
+            self.grid[0][bar * 16 + 0] = 127   # Beat 1
+            self.grid[0][bar * 16 + 8] = 100   # Beat 3
 
         # Snare on 2 and 4
         for bar in range(4):
-            self.pattern[(1, bar * 16 + 4)] = 127   # Beat 2
-            self.pattern[(1, bar * 16 + 12)] = 127  # Beat 4
+            self.grid[1][bar * 16 + 4] = 127   # Beat 2
+            self.grid[1][bar * 16 + 12] = 127  # Beat 4
 
         # Hi-hat 8ths
         for step in range(0, 64, 2):
-            self.pattern[(2, step)] = 80
+            self.grid[2][step] = 80
 
         # Some percussion accents
         for step in [3, 7, 11, 19, 23, 35, 51]:
-            self.pattern[(3, step)] = random.randint(60, 100)
+            self.grid[3][step] = random.randint(60, 100)
 
     def connect(self):
         """Connect to Push hardware."""
@@ -118,6 +172,10 @@ class PianoRollDisplay:
             print("ERROR: Push not found!")
             return False
 
+        # SysEx built here is already in range, so skip mido's per-byte
+        # validation and hand it straight to the rtmidi backend when present
+        self._raw_send = raw_sender(self.push_out)
+
         # Wake up Push
         self._send_sysex([0x62, 0x00, 0x01, 0x01])
         time.sleep(0.1)
@@ -125,46 +183,107 @@ class PianoRollDisplay:
 
     def _send_sysex(self, data):
         """Send SysEx to Push."""
-        self.push_out.send(mido.Message('sysex', data=SYSEX_HEADER + data))
+        if self._raw_send:
+            self._raw_send(SYSEX_START + bytes(data) + b'\xF7')
+        else:
+            self.push_out.send(mido.Message('sysex', data=SYSEX_HEADER + data))
 
     def set_lcd_line(self, line, text):
         """Set a full LCD line (68 chars)."""
         text = text[:68].ljust(68)
-        line_addr = LCD_LINES[line]
-        data = SYSEX_HEADER + [line_addr, 0x00, 0x45, 0x00]
-        data.extend([ord(c) if ord(c) < 128 else ord('?') for c in text])
-        self.push_out.send(mido.Message('sysex', data=data))
+        self.set_lcd_line_bytes(line, text.encode('ascii', 'replace'))  # BLOCK (0x05) is ASCII
+
+    def set_lcd_line_bytes(self, line, data):
+        """Set a full LCD line from 68 ASCII bytes. Skipped if unchanged."""
+        if data == self._last_lines[line - 1]:
+            return
+        self._last_lines[line - 1] = bytes(data)
+
+        frame = self._line_frames[line - 1]
+        frame[LINE_TEXT] = data
+        if self._raw_send:
+            self._raw_send(frame)
+        else:
+            self.push_out.send(mido.Message('sysex', data=memoryview(frame)[1:-1]))
+
+    def _start_midi_reader(self):
+        """Queue Push input for the main loop from mido's input callback."""
+        def read(msg):
+            self._midi_q.put(msg)
+            try:
+                os.write(self._wake_w, b'\0')
+            except (OSError, TypeError):
+                pass  # Wake pipe already closed by disconnect()
+        # A callback rather than a thread blocked in receive(): closing the
+        # port deregisters it, whereas a blocked receive() never wakes
+        self.push_in.callback = read
+
+    def _wait_timeout(self):
+        """Seconds until the next redraw: the next playhead step or frame."""
+        if self.playing and self._start_ns is not None:
+            until_step = self._step_ns - (time.monotonic_ns() - self._start_ns) % self._step_ns
+            return min(FRAME_INTERVAL, until_step / 1e9)
+        return FRAME_INTERVAL
+
+    def handle_midi(self, msg):
+        """Handle a message from Push."""
+        if msg.type == 'control_change':
+            self.handle_button(msg.control, msg.value)
 
     def set_button_led(self, cc, value):
         """Set button LED. value: 0=off, 1=dim, 4=bright"""
         self.push_out.send(mido.Message('control_change', control=cc, value=value))
 
-    def render_piano_roll(self):
-        """Render the pattern to LCD.
+    def render_cells(self, row_idx, first_step, count):
+        """Render `count` steps of a grid row as LCD bytes.
 
-        Layout: 4 segments x 17 chars = 68 chars
-        Each segment = 16 steps + 1 bar separator
-        Total = 64 steps visible (4 bars)
+        Notes show as BLOCK, the playhead (while playing) on an empty step
+        as PLAYHEAD, everything else (including steps past the pattern end)
+        as EMPTY.
         """
-        for row_offset in range(4):
-            row_idx = 3 - row_offset  # Invert so higher pitches are on top
+        row = self.grid[row_idx]
+        cells = row[first_step:first_step + count].translate(CELL_TABLE)
+        cells = cells.ljust(count, EMPTY_CELL)
+
+        playhead = self.playhead_pos - first_step
+        if self.playing and 0 <= playhead < count and cells[playhead] == EMPTY_ORD:
+            cells[playhead] = PLAY_ORD
+        return cells
+
+    def draw_steps(self, frame, row_idx, first_col=0):
+        """Draw a grid row from the view offset into a frame's step columns.
 
-            line = ""
+        Fills every step column from first_col on, skipping the bar columns.
+        """
+        cells = self.render_cells(row_idx, self.view_offset_x, 64 - first_col)
+        i = 0
+        for start, end in SEGMENT_SPANS:
+            start = max(start, first_col)
+            if start < end:
+                frame[start:end] = cells[i:i + end - start]
+                i += end - start
 
-            for seg in range(4):
-                for step_in_seg in range(16):
-                    step = self.view_offset_x + (seg * 16) + step_in_seg
+    def render(self, mode):
+        """Render the pattern to LCD in one of RENDER_MODES.
 
-                    if (row_idx, step) in self.pattern:
-                        line += BLOCK
-                    elif step == self.playhead_pos and self.playing:
-                        line += PLAYHEAD
-                    else:
-                        line += EMPTY
+        Layout: 4 segments x 17 chars = 68 chars
+        Each segment = 16 steps + 1 bar separator
+        Total = 64 steps visible (4 bars of 16th notes)
 
-                line += BAR
+        Labeled mode puts a 2-char pitch label on the left edge, leaving
+        14 steps in the first segment.
+        """
+        row_order, labeled = RENDER_MODES[mode]
 
-            self.set_lcd_line(row_offset + 1, line[:68])
+        for row_offset, row_idx in enumerate(row_order):
+            frame = self._frame[row_offset]
+            first_col = 0
+            if labeled:
+                frame[0:2] = get_note_name(self.base_note + row_idx)[:2].ljust(2).encode()
+                first_col = 2
+            self.draw_steps(frame, row_idx, first_col)
+
+            self.set_lcd_line_bytes(row_offset + 1, frame)
 
     def render_status_bar(self):
         """Show status on line 4 instead of pattern."""
@@ -178,76 +297,6 @@ class PianoRollDisplay:
         line = f"{status:^17}{playing:^17}{pos:^17}{'UP/DN=Scroll':^17}"
         self.set_lcd_line(4, line[:68])
 
-    def render_with_labels(self):
-        """Render with pitch labels on the left edge.
-
-        Line format: "C4" + 16 steps per segment
-        First segment has 2-char label + 14 steps + bar
-        Other segments have 16 steps + bar
-        """
-        for row_offset in range(4):
-            row_idx = 3 - row_offset  # Higher pitches on top
-            midi_note = self.base_note + row_idx
-            note_name = get_note_name(midi_note)[:2].ljust(2)
-
-            line = note_name  # Start with label
-
-            # First segment: 14 steps after 2-char label
-            for step_in_seg in range(14):
-                step = self.view_offset_x + step_in_seg
-                if (row_idx, step) in self.pattern:
-                    line += BLOCK
-                elif step == self.playhead_pos and self.playing:
-                    line += PLAYHEAD
-                else:
-                    line += EMPTY
-            line += BAR
-
-            # Remaining 3 segments: 16 steps each
-            for seg in range(1, 4):
-                for step_in_seg in range(16):
-                    step = self.view_offset_x + 14 + ((seg - 1) * 16) + step_in_seg
-                    if (row_idx, step) in self.pattern:
-                        line += BLOCK
-                    elif step == self.playhead_pos and self.playing:
-                        line += PLAYHEAD
-                    else:
-                        line += EMPTY
-                line += BAR
-
-            self.set_lcd_line(row_offset + 1, line[:68])
-
-    def render_drum_mode(self):
-        """Render for drums with lane names.
-
-        Layout: 4 segments x 17 chars = 68 chars
-        Each segment = 16 steps + 1 bar separator
-        Total = 64 steps visible (4 bars of 16th notes)
-        """
-        drum_names = ['KICK', 'SNAR', 'HHAT', 'PERC']
-
-        for row_offset in range(4):
-            row_idx = row_offset
-
-            line = ""
-
-            for seg in range(4):
-                # 16 steps per segment
-                for step_in_seg in range(16):
-                    step = self.view_offset_x + (seg * 16) + step_in_seg
-
-                    if (row_idx, step) in self.pattern:
-                        line += BLOCK
-                    elif step == self.playhead_pos and self.playing:
-                        line += PLAYHEAD
-                    else:
-                        line += EMPTY
-
-                # Bar separator after each 16 steps
-                line += BAR
-
-            self.set_lcd_line(row_offset + 1, line[:68])
-
     def handle_button(self, cc, value):
         """Handle button presses."""
         if value == 0:  # Release
@@ -275,10 +324,12 @@ class PianoRollDisplay:
 
         elif cc == BUTTONS['play']:
             self.playing = not self.playing
+            self._start_ns = None
             print(f"Playing: {self.playing}")
 
         elif cc == BUTTONS['stop']:
             self.playing = False
+            self._start_ns = None
             self.playhead_pos = 0
             print("Stopped and reset")
 
@@ -291,10 +342,13 @@ class PianoRollDisplay:
         if not self.playing:
             return
 
-        now = time.time()
-        if now - self.last_step_time >= self.step_duration:
-            self.playhead_pos = (self.playhead_pos + 1) % self.steps
-            self.last_step_time = now
+        now = time.monotonic_ns()
+        if self._start_ns is None:
+            # (Re)started: anchor the clock so playback resumes from here
+            self._start_ns = now - self.playhead_pos * self._step_ns
+
+        # Whole steps since the anchor, so late frames catch up without drift
+        self.playhead_pos = (now - self._start_ns) // self._step_ns % self.steps
 
     def init_ui(self):
         """Initialize button LEDs."""
@@ -316,12 +370,27 @@ class PianoRollDisplay:
         for cc in BUTTONS.values():
             self.set_button_led(cc, 0)
 
+    def disconnect(self):
+        """Close the ports, then release the MIDI reader's wake pipe."""
+        if self.push_in:
+            self.push_in.close()  # Stops the reader callback
+            self.push_in = None
+        if self.push_out:
+            self.push_out.close()
+            self.push_out = None
+        if self._wake_r is not None:
+            os.close(self._wake_r)
+            os.close(self._wake_w)
+            self._wake_r = self._wake_w = None
+
     def run(self):
         """Main loop."""
         if not self.connect():
+            self.disconnect()
             return
 
         self.init_ui()
+        self._start_midi_reader()
 
         print("\n=== Piano Roll Display Experiment ===")
         print("Up/Down: Scroll pitches")
@@ -340,20 +409,21 @@ class PianoRollDisplay:
                 self.advance_playhead()
 
                 # Render based on mode
-                if render_mode == 'drum':
-                    self.render_drum_mode()
-                elif render_mode == 'labeled':
-                    self.render_with_labels()
-                else:
-                    self.render_piano_roll()
-
-                # Handle Push input
-                for msg in self.push_in.iter_pending():
-                    if msg.type == 'control_change':
-                        self.handle_button(msg.control, msg.value)
+                self.render(render_mode)
+
+                # Wait for keyboard or Push input, the next step, or the
+                # next frame, whichever comes first
+                ready = select.select([sys.stdin, self._wake_r], [], [],
+                                      self._wait_timeout())[0]
+
+                # Handle Push input queued by the reader callback
+                if self._wake_r in ready:
+                    os.read(self._wake_r, 4096)
+                while not self._midi_q.empty():
+                    self.handle_midi(self._midi_q.get_nowait())
 
                 # Handle keyboard input
-                if select.select([sys.stdin], [], [], 0)[0]:
+                if sys.stdin in ready:
                     key = sys.stdin.read(1).lower()
                     if key == 'q':
                         self.running = False
@@ -368,15 +438,15 @@ class PianoRollDisplay:
                         print("Mode: Labeled piano")
                     elif key == ' ':
                         self.playing = not self.playing
+                        self._start_ns = None
                         print(f"Playing: {self.playing}")
 
-                time.sleep(0.02)  # ~50fps update
-
         except KeyboardInterrupt:
             print("\nInterrupted")
 
         finally:
             self.cleanup()
+            self.disconnect()
             print("Done!")
 
 
@@ -15,7 +15,15 @@ Segment layout per line:
 """
 
 import mido
+import os
+import sys
 import time
+from contextlib import contextmanager
+
+# Push 1 protocol helpers live in the open_push package under src/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from open_push.core.hardware import raw_sender
 
 # SysEx constants
 SYSEX_HEADER = [0x47, 0x7F, 0x15]
@@ -33,6 +41,25 @@ LCD_LINES = {
 CHARS_PER_LINE = 68
 SEGMENT_COUNT = 4
 CHARS_PER_SEGMENT = 17  # 68 / 4 = 17
+BLANK_LINE = b' ' * CHARS_PER_LINE
+
+# Field (start, width) per encoder: 68 / 8 = 8.5, so alternate 8 and 9
+FIELD_POSITIONS = [
+    (0, 8),    # Field 0: chars 0-7
+    (8, 9),    # Field 1: chars 8-16
+    (17, 8),   # Field 2: chars 17-24
+    (25, 9),   # Field 3: chars 25-33
+    (34, 8),   # Field 4: chars 34-41
+    (42, 9),   # Field 5: chars 42-50
+    (51, 8),   # Field 6: chars 51-58
+    (59, 9),   # Field 7: chars 59-67
+]
+
+# Full sysex prefix per line: header, line address, 0x00, length, offset
+LINE_PREFIX = {
+    line: bytes(SYSEX_HEADER + [addr, 0x00, 0x45, 0x00])
+    for line, addr in LCD_LINES.items()
+}
 
 
 class Push1Display:
@@ -40,28 +67,73 @@ class Push1Display:
 
     def __init__(self, port):
         self.port = port
-        # Internal buffer: 4 lines × 68 characters
-        self.buffer = [[' '] * CHARS_PER_LINE for _ in range(4)]
+        # SysEx built here is already in range, so skip mido's per-byte
+        # validation and hand it straight to the rtmidi backend when present
+        self._raw_send = raw_sender(port)
+        # Internal buffer: 4 lines × 68 ASCII bytes
+        self.buffer = [bytearray(BLANK_LINE) for _ in range(4)]
+        # Last bytes sent per line, so unchanged lines aren't resent
+        self._last_sent = [None] * 4
+        # Set inside batch(): writes only touch the buffer until it ends
+        self._defer = False
 
     def _send_sysex(self, data):
         """Send a SysEx message."""
+        if self._raw_send:
+            self._raw_send(bytes([0xF0] + SYSEX_HEADER + data + [0xF7]))
+            return
         msg = mido.Message('sysex', data=SYSEX_HEADER + data)
         self.port.send(msg)
 
     def _flush_line(self, line_num):
-        """Send a line from buffer to hardware."""
-        if line_num < 1 or line_num > 4:
+        """Send a line from buffer to hardware (skipped if unchanged)."""
+        if line_num < 1 or line_num > 4 or self._defer:
             return
-        line_addr = LCD_LINES[line_num]
-        text = ''.join(self.buffer[line_num - 1])
-        data = [line_addr, 0x00, 0x45, 0x00]
-        data.extend([ord(c) for c in text])
-        self._send_sysex(data)
+        text = bytes(self.buffer[line_num - 1])
+        if text == self._last_sent[line_num - 1]:
+            return
+        self._last_sent[line_num - 1] = text
+
+        if self._raw_send:
+            self._raw_send(b'\xF0' + LINE_PREFIX[line_num] + text + b'\xF7')
+        else:
+            self.port.send(mido.Message('sysex', data=LINE_PREFIX[line_num] + text))
+
+    def _write(self, line_num, start, width, text, align='left'):
+        """Align text to width and store it at start in a line's buffer."""
+        text = text[:width]
+        if align == 'center':
+            text = text.center(width)
+        elif align == 'right':
+            text = text.rjust(width)
+        else:  # left
+            text = text.ljust(width)
+        self.buffer[line_num - 1][start:start + width] = text.encode('ascii', 'replace')
+
+    @contextmanager
+    def batch(self):
+        """
+        Defer hardware updates until the block ends, then send each changed
+        line once. Use for many writes in a row:
+
+            with display.batch():
+                display.set_field(1, 0, "Vol")
+                display.set_field(2, 0, "64")
+        """
+        outer = self._defer
+        self._defer = True
+        try:
+            yield self
+        finally:
+            self._defer = outer
+            if not outer:
+                for line in range(1, 5):
+                    self._flush_line(line)
 
     def clear(self):
         """Clear all lines."""
-        for i in range(4):
-            self.buffer[i] = [' '] * CHARS_PER_LINE
+        for buf in self.buffer:
+            buf[:] = BLANK_LINE
         for line in range(1, 5):
             self._flush_line(line)
 
@@ -69,8 +141,7 @@ class Push1Display:
         """Set a full line (68 chars, will be truncated/padded)."""
         if line_num < 1 or line_num > 4:
             return
-        text = text.ljust(CHARS_PER_LINE)[:CHARS_PER_LINE]
-        self.buffer[line_num - 1] = list(text)
+        self._write(line_num, 0, CHARS_PER_LINE, text)
         self._flush_line(line_num)
 
     def set_segment(self, line_num, segment, text, align='left'):
@@ -88,21 +159,9 @@ class Push1Display:
         if segment < 0 or segment > 3:
             return
 
-        # Truncate to segment width
-        text = text[:CHARS_PER_SEGMENT]
-
-        # Apply alignment
-        if align == 'center':
-            text = text.center(CHARS_PER_SEGMENT)
-        elif align == 'right':
-            text = text.rjust(CHARS_PER_SEGMENT)
-        else:  # left
-            text = text.ljust(CHARS_PER_SEGMENT)
-
-        # Calculate position in buffer
+        # Truncate and align to segment width at its position in the buffer
         start = segment * CHARS_PER_SEGMENT
-        for i, char in enumerate(text):
-            self.buffer[line_num - 1][start + i] = char
+        self._write(line_num, start, CHARS_PER_SEGMENT, text, align)
 
         self._flush_line(line_num)
 
@@ -115,8 +174,9 @@ class Push1Display:
             texts: List of up to 4 strings
             align: 'left', 'center', or 'right'
         """
-        for i, text in enumerate(texts[:4]):
-            self.set_segment(line_num, i, text, align)
+        with self.batch():  # One line update instead of one per segment
+            for i, text in enumerate(texts[:4]):
+                self.set_segment(line_num, i, text, align)
 
     def set_field(self, line_num, field, text, align='center'):
         """
@@ -137,32 +197,8 @@ class Push1Display:
         # Each field is ~8 chars, but segments are 17 chars
         # Field 0-1 in segment 0, field 2-3 in segment 1, etc.
         # Field widths: 8 + 9 = 17 per segment pair
-
-        # Approximate positions for 8 fields across 68 chars
-        # 68 / 8 = 8.5, so alternate 8 and 9
-        field_positions = [
-            (0, 8),    # Field 0: chars 0-7
-            (8, 9),    # Field 1: chars 8-16
-            (17, 8),   # Field 2: chars 17-24
-            (25, 9),   # Field 3: chars 25-33
-            (34, 8),   # Field 4: chars 34-41
-            (42, 9),   # Field 5: chars 42-50
-            (51, 8),   # Field 6: chars 51-58
-            (59, 9),   # Field 7: chars 59-67
-        ]
-
-        start, width = field_positions[field]
-        text = text[:width]
-
-        if align == 'center':
-            text = text.center(width)
-        elif align == 'right':
-            text = text.rjust(width)
-        else:
-            text = text.ljust(width)
-
-        for i, char in enumerate(text):
-            self.buffer[line_num - 1][start + i] = char
+        start, width = FIELD_POSITIONS[field]
+        self._write(line_num, start, width, text, align)
 
         self._flush_line(line_num)
 
@@ -175,8 +211,9 @@ class Push1Display:
             texts: List of up to 8 strings
             align: 'left', 'center', or 'right'
         """
-        for i, text in enumerate(texts[:8]):
-            self.set_field(line_num, i, text, align)
+        with self.batch():  # One line update instead of one per field
+            for i, text in enumerate(texts[:8]):
+                self.set_field(line_num, i, text, align)
 
 
 def find_push_port():
@@ -46,8 +46,30 @@ BOLD = '\033[1m'
 BG_BLACK = '\033[40m'
 CLEAR_SCREEN = '\033[2J\033[H'
 
+# Fixed parts of the simulator screen around the LCD and button rows
+REDRAW_HEADER = (
+    '\033[H'  # Cursor home
+    + f"\n{BOLD}  Push 1 Simulator{RESET} (Terminal Mode)\n"
+    + "  " + "=" * 50 + "\n"
+    + f"\n  {BG_BLACK}╔{'═' * 70}╗{RESET}\n"
+)
+LCD_BOTTOM = f"  {BG_BLACK}╚{'═' * 70}╝{RESET}\n"
+REDRAW_FOOTER = (
+    "\n  " + "-" * 50 + "\n"
+    + f"  {DIM}Keys: 1-8=Upper | q-i=Lower | Space=Play | n=Note | z=Scale{RESET}\n"
+    + f"  {DIM}      [/]=Octave | v=Vol | b=Track | d=Device | Esc=Quit{RESET}\n"
+)
+
+# Terminal repaint rate cap (LCD changes are coalesced between repaints)
+REDRAW_INTERVAL = 1 / 30
+
 # Push 1 Constants
 SYSEX_HEADER = [0x47, 0x7F, 0x15]
+SYSEX_HEADER_BYTES = bytes(SYSEX_HEADER)
+LCD_LINE_INDEX = {0x18: 0, 0x19: 1, 0x1A: 2, 0x1B: 3}
+
+# LCD byte -> printable ASCII (anything else shows as a space)
+LCD_CHAR_TABLE = bytes(c if 32 <= c < 127 else 32 for c in range(256))
 
 # Keyboard to CC mapping
 KEY_MAP = {
@@ -94,6 +116,7 @@ class TerminalSimulator:
         self.midi_in = None
         self.running = True
         self.lcd_lines = ["", "", "", ""]
+        self._dirty = False  # LCD or button LEDs changed since the last repaint
         self.button_states = {}
         self.old_settings = None
 
@@ -108,38 +131,51 @@ class TerminalSimulator:
             return False
 
     def _start_midi_listener(self):
-        """Listen for MIDI from app."""
+        """Listen for MIDI from app (blocks until a message arrives)."""
         def listen():
-            while self.running:
-                if self.midi_in:
-                    for msg in self.midi_in.iter_pending():
-                        self._handle_midi(msg)
-                time.sleep(0.02)
+            while self.running and self.midi_in:
+                try:
+                    msg = self.midi_in.receive()
+                except (OSError, ValueError):
+                    break  # Port closed on exit
+                self._handle_midi(msg)
         threading.Thread(target=listen, daemon=True).start()
 
+    def _start_repaint_thread(self):
+        """Repaint at most REDRAW_INTERVAL apart, and only after a change."""
+        def repaint():
+            while self.running:
+                if self._dirty:
+                    self._dirty = False
+                    self._redraw()
+                time.sleep(REDRAW_INTERVAL)
+        threading.Thread(target=repaint, daemon=True).start()
+
     def _handle_midi(self, msg):
         """Handle incoming MIDI (LED/LCD updates)."""
         if msg.type == 'sysex':
             self._handle_sysex(msg.data)
         elif msg.type == 'control_change':
-            self.button_states[msg.control] = msg.value
+            if self.button_states.get(msg.control) != msg.value:
+                self.button_states[msg.control] = msg.value
+                self._dirty = True
         elif msg.type == 'note_on':
             pass  # Pad color updates
 
     def _handle_sysex(self, data):
         """Parse SysEx for LCD updates."""
-        data = list(data)
-        if len(data) < 4 or data[0:3] != SYSEX_HEADER:
+        data = bytes(data)
+        if len(data) < 4 or not data.startswith(SYSEX_HEADER_BYTES):
             return
 
         # LCD update
         if len(data) > 7 and data[4] == 0x00 and data[5] == 0x45:
-            line_map = {0x18: 0, 0x19: 1, 0x1A: 2, 0x1B: 3}
-            if data[3] in line_map:
-                idx = line_map[data[3]]
-                text = ''.join(chr(b) if 32 <= b < 127 else ' ' for b in data[7:])
-                self.lcd_lines[idx] = text
-                self._redraw()
+            if data[3] in LCD_LINE_INDEX:
+                idx = LCD_LINE_INDEX[data[3]]
+                text = data[7:].translate(LCD_CHAR_TABLE).decode('ascii')
+                if self.lcd_lines[idx] != text:
+                    self.lcd_lines[idx] = text
+                    self._dirty = True
 
     def _send_button(self, cc, value):
         """Send button CC."""
@@ -153,38 +189,27 @@ class TerminalSimulator:
             self.midi_out.send(mido.Message(msg_type, note=note, velocity=velocity))
 
     def _redraw(self):
-        """Redraw the terminal display."""
-        # Move cursor to home
-        print('\033[H', end='')
-
-        print(f"\n{BOLD}  Push 1 Simulator{RESET} (Terminal Mode)")
-        print("  " + "=" * 50)
+        """Redraw the terminal display in a single write."""
+        parts = [REDRAW_HEADER]
 
         # LCD Display
-        print(f"\n  {BG_BLACK}╔{'═' * 70}╗{RESET}")
-        for i, line in enumerate(self.lcd_lines):
+        for line in self.lcd_lines:
             text = line[:68].ljust(68) if line else " " * 68
-            print(f"  {BG_BLACK}║ {ORANGE}{text}{RESET} {BG_BLACK}║{RESET}")
-        print(f"  {BG_BLACK}╚{'═' * 70}╝{RESET}")
+            parts.append(f"  {BG_BLACK}║ {ORANGE}{text}{RESET} {BG_BLACK}║{RESET}\n")
+        parts.append(LCD_BOTTOM)
 
         # Button indicators
-        upper = "  Upper: "
-        for cc in range(102, 110):
-            state = self.button_states.get(cc, 0)
-            marker = "●" if state >= 4 else "○" if state > 0 else "·"
-            upper += f" {marker} "
-        print(upper)
-
-        lower = "  Lower: "
-        for cc in range(20, 28):
-            state = self.button_states.get(cc, 0)
-            marker = "●" if state >= 4 else "○" if state > 0 else "·"
-            lower += f" {marker} "
-        print(lower)
-
-        print("\n  " + "-" * 50)
-        print(f"  {DIM}Keys: 1-8=Upper | q-i=Lower | Space=Play | n=Note | z=Scale{RESET}")
-        print(f"  {DIM}      [/]=Octave | v=Vol | b=Track | d=Device | Esc=Quit{RESET}")
+        for label, ccs in (("  Upper: ", range(102, 110)), ("  Lower: ", range(20, 28))):
+            parts.append(label)
+            for cc in ccs:
+                state = self.button_states.get(cc, 0)
+                marker = "●" if state >= 4 else "○" if state > 0 else "·"
+                parts.append(f" {marker} ")
+            parts.append("\n")
+
+        parts.append(REDRAW_FOOTER)
+        sys.stdout.write(''.join(parts))
+        sys.stdout.flush()
 
     def _get_key(self):
         """Get a single keypress."""
@@ -210,6 +235,7 @@ class TerminalSimulator:
         print("\nPress any key to start, Escape to quit...")
 
         self._start_midi_listener()
+        self._start_repaint_thread()
 
         if HAS_TERMIOS:
             # Set terminal to raw mode
@@ -23,31 +23,22 @@ LCD Display Notes:
 """
 
 import mido
+import threading
 import time
 import sys
+import os
 
-# =============================================================================
-# PUSH 1 PROTOCOL CONSTANTS
-# =============================================================================
-
-# SysEx header for Push 1: F0 47 7F 15 ...
-SYSEX_HEADER = [0x47, 0x7F, 0x15]
+# Push 1 protocol constants and helpers live in the open_push package under src/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-# Mode switching
-USER_MODE = [0x62, 0x00, 0x01, 0x01]   # Switch to User Mode
-LIVE_MODE = [0x62, 0x00, 0x01, 0x00]   # Switch to Live Mode
-
-# LCD line addresses (Push 1 has 4 lines, 68 chars each)
-LCD_LINES = {
-    1: 0x18,  # Line 1 (top)
-    2: 0x19,  # Line 2
-    3: 0x1A,  # Line 3
-    4: 0x1B,  # Line 4 (bottom)
-}
+from open_push.core.constants import NOTE_TO_PAD, PAD_NOTES, PUSH1_USER_MODE
+from open_push.core.console import flush_log, log, start_log_writer
+from open_push.core.display import clear_lcd, format_segments, set_lcd_line
+from open_push.core.hardware import find_push_ports, send_frames, send_sysex
 
-# LCD geometry
-CHARS_PER_LINE = 68
-CHARS_PER_SEGMENT = 17  # 4 segments × 17 chars = 68
+# =============================================================================
+# DEMO CONSTANTS
+# =============================================================================
 
 # Color palette (velocity values for pad LEDs)
 # Push 1 uses a fixed palette, not full RGB
@@ -72,116 +63,69 @@ COLORS = {
     'pink': 57,
 }
 
+# Palette clamped to 7-bit data bytes, for building raw frames
+COLOR_VEL = {name: value & 0x7F for name, value in COLORS.items()}
+
 # Pad note numbers (8x8 grid, bottom-left = 36)
 def pad_note(row, col):
     """Get MIDI note number for pad at (row, col). Row 0 = bottom, Col 0 = left."""
     return 36 + (row * 8) + col
 
+# Rainbow diagonal pattern: one color per (row + col) diagonal
+RAINBOW_COLORS = ['red', 'orange', 'yellow', 'green', 'cyan', 'blue', 'purple', 'pink']
+
+# Rainbow velocity for every pad, indexed by note - 36
+RAINBOW_VEL = bytes(
+    COLORS[RAINBOW_COLORS[(row + col) % len(RAINBOW_COLORS)]]
+    for row in range(8)
+    for col in range(8)
+)
+
+# Startup LCD banner, one 68-character line per LCD line
+BANNER_LINES = {
+    1: format_segments("PUSH AWAKE!", "No Ableton", "Required!", "open-push"),
+    2: format_segments("Controlled by", "Python", "not Live!", ""),
+    3: format_segments("", "Press any pad", "to test input", ""),
+    4: format_segments("Ctrl+C to exit", "", "", "v0.1"),
+}
+
+# Prebuilt raw frames that switch every pad / lit button off
+PADS_OFF = tuple(bytes((0x90, note, 0)) for note in range(36, 100))
+BUTTONS_OFF = tuple(bytes((0xB0, cc, 0)) for cc in (*range(102, 110), 85, 86))
+
 
 # =============================================================================
 # MIDI HELPER FUNCTIONS
 # =============================================================================
 
-def find_push_ports():
-    """Find Push MIDI ports."""
-    inputs = mido.get_input_names()
-    outputs = mido.get_output_names()
-
-    push_in = None
-    push_out = None
-
-    for name in inputs:
-        if 'Ableton Push' in name and 'User' in name:
-            push_in = name
-            break
-        elif 'Ableton Push' in name:
-            push_in = name
+def set_user_mode(port):
+    """Switch Push to User Mode."""
+    send_sysex(port, PUSH1_USER_MODE)
 
-    for name in outputs:
-        if 'Ableton Push' in name and 'User' in name:
-            push_out = name
-            break
-        elif 'Ableton Push' in name:
-            push_out = name
 
-    return push_in, push_out
+def pad_frame(note, color):
+    """Build the Note On frame for a pad. color is a palette name or velocity."""
+    return bytes((0x90, note, COLOR_VEL[color] if type(color) is str else color))
 
 
-def send_sysex(port, data):
-    """Send a SysEx message to Push."""
-    msg = mido.Message('sysex', data=SYSEX_HEADER + data)
-    port.send(msg)
-
-
-def set_user_mode(port):
-    """Switch Push to User Mode."""
-    send_sysex(port, USER_MODE)
+def button_frame(cc, color):
+    """Build the CC frame for a button LED. color is a palette name or value."""
+    return bytes((0xB0, cc, COLOR_VEL[color] if type(color) is str else color))
 
 
 def set_pad_color(port, note, color):
     """Set a pad's LED color by sending a Note On message."""
-    velocity = COLORS.get(color, color) if isinstance(color, str) else color
-    msg = mido.Message('note_on', note=note, velocity=velocity)
-    port.send(msg)
+    send_frames(port, (pad_frame(note, color),))
 
 
 def set_button_color(port, cc, color):
     """Set a button's LED color by sending a CC message."""
-    value = COLORS.get(color, color) if isinstance(color, str) else color
-    msg = mido.Message('control_change', control=cc, value=value)
-    port.send(msg)
+    send_frames(port, (button_frame(cc, color),))
 
 
 def clear_all_pads(port):
     """Turn off all pad LEDs."""
-    for note in range(36, 100):  # Pads are notes 36-99
-        set_pad_color(port, note, 'off')
-
-
-def format_segments(seg0="", seg1="", seg2="", seg3=""):
-    """
-    Format text into 4 segments for Push 1 LCD.
-    Each segment is 17 chars, centered by default.
-    Returns a 68-character string.
-    """
-    parts = [seg0, seg1, seg2, seg3]
-    line = ""
-    for part in parts:
-        line += part[:CHARS_PER_SEGMENT].center(CHARS_PER_SEGMENT)
-    return line
-
-
-def set_lcd_line(port, line_num, text):
-    """
-    Set text on a specific LCD line.
-
-    Push 1 LCD format:
-    F0 47 7F 15 [line] 00 45 00 [68 ASCII bytes] F7
-
-    Note: The display has 4 physical segments with gaps.
-    Use format_segments() for clean display.
-    """
-    # Pad or truncate text to 68 characters
-    text = text.ljust(CHARS_PER_LINE)[:CHARS_PER_LINE]
-
-    # Build the SysEx data
-    line_addr = LCD_LINES.get(line_num, LCD_LINES[1])
-    data = [line_addr, 0x00, 0x45, 0x00]
-    data.extend([ord(c) for c in text])
-
-    send_sysex(port, data)
-
-
-def set_lcd_segments(port, line_num, seg0="", seg1="", seg2="", seg3=""):
-    """Set LCD line using 4 segments (17 chars each, centered)."""
-    text = format_segments(seg0, seg1, seg2, seg3)
-    set_lcd_line(port, line_num, text)
-
-
-def clear_lcd(port):
-    """Clear all LCD lines."""
-    for line in range(1, 5):
-        set_lcd_line(port, line, "")
+    send_frames(port, PADS_OFF)
 
 
 # =============================================================================
@@ -217,39 +161,29 @@ def main():
         # Step 1: Switch to User Mode
         print("Sending User Mode command...")
         set_user_mode(port)
-        time.sleep(0.1)
+        time.sleep(0.1)  # Give Push time to switch modes
 
         # Step 2: Clear everything
         print("Clearing display and pads...")
         clear_lcd(port)
         clear_all_pads(port)
-        time.sleep(0.1)
 
         # Step 3: Set LCD text (using segment-aware formatting)
         print("Setting LCD text...")
-        set_lcd_segments(port, 1, "PUSH AWAKE!", "No Ableton", "Required!", "open-push")
-        set_lcd_segments(port, 2, "Controlled by", "Python", "not Live!", "")
-        set_lcd_segments(port, 3, "", "Press any pad", "to test input", "")
-        set_lcd_segments(port, 4, "Ctrl+C to exit", "", "", "v0.1")
-        time.sleep(0.1)
+        for line_num, text in BANNER_LINES.items():
+            set_lcd_line(port, line_num, text)
 
         # Step 4: Light up pads in a pattern
         print("Lighting up pads...")
 
         # Rainbow diagonal pattern
-        colors_list = ['red', 'orange', 'yellow', 'green', 'cyan', 'blue', 'purple', 'pink']
-        for row in range(8):
-            for col in range(8):
-                color_index = (row + col) % len(colors_list)
-                note = pad_note(row, col)
-                set_pad_color(port, note, colors_list[color_index])
-                time.sleep(0.01)  # Small delay for visual effect
+        send_frames(port, [pad_frame(note, vel) for note, vel in zip(PAD_NOTES, RAINBOW_VEL)])
 
         # Step 5: Light up some buttons
         print("Lighting up buttons...")
         # Upper row buttons (CC 102-109)
         for i, cc in enumerate(range(102, 110)):
-            set_button_color(port, cc, colors_list[i])
+            set_button_color(port, cc, RAINBOW_COLORS[i])
 
         # Transport buttons
         set_button_color(port, 85, 'green')   # Play
@@ -269,34 +203,63 @@ def main():
             print("Press Ctrl+C to exit.")
             print()
 
-            with mido.open_input(push_in) as in_port:
+            start_log_writer()
+
+            # Timers that put a flashed pad back to its rainbow color, by note
+            pending_restore = {}
+            # rtmidi sends aren't thread-safe, and restores run on timer
+            # threads alongside the MIDI callback: every send takes this lock
+            send_lock = threading.Lock()
+
+            def restore_pad(note):
+                with send_lock:
+                    set_pad_color(port, note, RAINBOW_VEL[note - 36])
+
+            def on_message(msg):
+                if msg.type == 'note_on' and msg.velocity > 0:
+                    # Look up row/col (None for notes outside the pad grid)
+                    note = msg.note
+                    pad = NOTE_TO_PAD[note]
+                    if pad:
+                        row, col = pad
+                        log(f"Pad pressed: Row {row+1}, Col {col+1} (Note {note}, Velocity {msg.velocity})")
+
+                        # Flash the pad white, then restore it from a timer so
+                        # the callback returns straight away; a repeat hit just
+                        # reschedules the restore
+                        with send_lock:
+                            set_pad_color(port, note, 'white')
+                        timer = pending_restore.get(note)
+                        if timer:
+                            timer.cancel()
+                        timer = threading.Timer(0.05, restore_pad, (note,))
+                        pending_restore[note] = timer
+                        timer.start()
+
+                elif msg.type == 'note_off' or (msg.type == 'note_on' and msg.velocity == 0):
+                    pass  # Pad released
+
+                elif msg.type == 'control_change':
+                    log(f"Button/Encoder: CC {msg.control} = {msg.value}")
+
+                else:
+                    log(f"Other: {msg}")
+
+            # mido registers the callback with rtmidi, which calls it from its
+            # own thread as messages arrive - nothing polls while idle
+            with mido.open_input(push_in, callback=on_message):
                 try:
-                    for msg in in_port:
-                        if msg.type == 'note_on' and msg.velocity > 0:
-                            # Calculate row/col from note
-                            note = msg.note
-                            if 36 <= note <= 99:
-                                row = (note - 36) // 8
-                                col = (note - 36) % 8
-                                print(f"Pad pressed: Row {row+1}, Col {col+1} (Note {note}, Velocity {msg.velocity})")
-
-                                # Flash the pad white then back to rainbow
-                                set_pad_color(port, note, 'white')
-                                time.sleep(0.05)
-                                color_index = (row + col) % len(colors_list)
-                                set_pad_color(port, note, colors_list[color_index])
-
-                        elif msg.type == 'note_off' or (msg.type == 'note_on' and msg.velocity == 0):
-                            pass  # Pad released
-
-                        elif msg.type == 'control_change':
-                            print(f"Button/Encoder: CC {msg.control} = {msg.value}")
-
-                        else:
-                            print(f"Other: {msg}")
-
+                    threading.Event().wait()
                 except KeyboardInterrupt:
+                    flush_log()
                     print("\n\nExiting...")
+
+            # Stop pending restores and wait out any already running, so none
+            # races the cleanup below
+            for timer in pending_restore.values():
+                timer.cancel()
+            for timer in pending_restore.values():
+                timer.join()
         else:
             print("No input port found - can't listen for pad presses.")
             print("Press Enter to exit...")
@@ -308,10 +271,7 @@ def main():
         clear_lcd(port)
 
         # Turn off buttons
-        for cc in range(102, 110):
-            set_button_color(port, cc, 'off')
-        set_button_color(port, 85, 'off')
-        set_button_color(port, 86, 'off')
+        send_frames(port, BUTTONS_OFF)
 
     print("Done!")
 
@@ -16,19 +16,22 @@ Usage:
 """
 
 import mido
+import threading
 import time
 import sys
+import os
 
-# =============================================================================
-# PUSH 1 PROTOCOL CONSTANTS
-# =============================================================================
+# Push 1 protocol constants and helpers live in the open_push package under src/
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-SYSEX_HEADER = [0x47, 0x7F, 0x15]
-USER_MODE = [0x62, 0x00, 0x01, 0x01]
+from open_push.core.constants import PUSH1_USER_MODE
+from open_push.core.console import flush_log, log, start_log_writer
+from open_push.core.display import clear_lcd, segments_frame
+from open_push.core.hardware import find_push_ports, send_frames, send_sysex
 
-LCD_LINES = {1: 0x18, 2: 0x19, 3: 0x1A, 4: 0x1B}
-CHARS_PER_LINE = 68
-CHARS_PER_SEGMENT = 17
+# =============================================================================
+# PUSH 1 CONTROLS
+# =============================================================================
 
 # Push button CCs
 BUTTON_PLAY = 85
@@ -45,31 +48,6 @@ LED_ON = 4
 # MIDI HELPER FUNCTIONS
 # =============================================================================
 
-def find_push_ports():
-    """Find Push MIDI ports."""
-    inputs = mido.get_input_names()
-    outputs = mido.get_output_names()
-
-    push_in = None
-    push_out = None
-
-    for name in inputs:
-        if 'Ableton Push' in name and 'User' in name:
-            push_in = name
-            break
-        elif 'Ableton Push' in name:
-            push_in = name
-
-    for name in outputs:
-        if 'Ableton Push' in name and 'User' in name:
-            push_out = name
-            break
-        elif 'Ableton Push' in name:
-            push_out = name
-
-    return push_in, push_out
-
-
 def find_seqtrak_port():
     """Find Seqtrak MIDI output port."""
     outputs = mido.get_output_names()
@@ -86,35 +64,17 @@ def find_seqtrak_port():
     return None
 
 
-def send_sysex(port, data):
-    """Send a SysEx message to Push."""
-    msg = mido.Message('sysex', data=SYSEX_HEADER + data)
-    port.send(msg)
-
-
-def set_lcd_segments(port, line_num, seg0="", seg1="", seg2="", seg3=""):
-    """Set LCD line using 4 segments (17 chars each, centered)."""
-    parts = [seg0, seg1, seg2, seg3]
-    text = ""
-    for part in parts:
-        text += part[:CHARS_PER_SEGMENT].center(CHARS_PER_SEGMENT)
-
-    line_addr = LCD_LINES.get(line_num, LCD_LINES[1])
-    data = [line_addr, 0x00, 0x45, 0x00]
-    data.extend([ord(c) for c in text])
-    send_sysex(port, data)
-
-
 def set_button_led(port, cc, value):
     """Set a button's LED state (0=off, 1=dim, 4=on)."""
-    msg = mido.Message('control_change', control=cc, value=value)
-    port.send(msg)
+    send_frames(port, (bytes((0xB0, cc, value)),))
 
 
-def clear_lcd(port):
-    """Clear all LCD lines."""
-    for line in range(1, 5):
-        set_lcd_segments(port, line)
+# Fixed LCD banner (lines 1, 3 and 4), built once at import
+BANNER_FRAMES = (
+    segments_frame(1, "SEQTRAK", "TRANSPORT", "CONTROL", "v0.1"),
+    segments_frame(3, "Play: CC 85", "Stop: CC 29", "", ""),
+    segments_frame(4, "Ctrl+C to exit", "", "", "open-push"),
+)
 
 
 # =============================================================================
@@ -128,19 +88,37 @@ class SeqtrakTransport:
         self.push_out = push_out
         self.seqtrak_out = seqtrak_out
         self.is_playing = False
+        # State last drawn by update_display (None = nothing drawn yet)
+        self._shown_playing = None
+
+        # Raw frames for each state, keyed by is_playing: LCD line 2,
+        # then the Play and Stop button LEDs
+        self._frames = {
+            True: (
+                segments_frame(2, "", ">>> PLAYING >>>", "", ""),
+                bytes((0xB0, BUTTON_PLAY, LED_ON)),    # Play lit
+                bytes((0xB0, BUTTON_STOP, LED_DIM)),   # Stop dim
+            ),
+            False: (
+                segments_frame(2, "", "[ STOPPED ]", "", ""),
+                bytes((0xB0, BUTTON_PLAY, LED_DIM)),   # Play dim
+                bytes((0xB0, BUTTON_STOP, LED_ON)),    # Stop lit
+            ),
+        }
+
+        # play/stop run on the input callback thread as well as the main
+        # thread; the lock makes checking the drawn state and sending its
+        # frame burst one step
+        self._send_lock = threading.Lock()
 
     def update_display(self):
         """Update Push LCD and button LEDs to reflect current state."""
-        if self.is_playing:
-            # Playing state
-            set_lcd_segments(self.push_out, 2, "", ">>> PLAYING >>>", "", "")
-            set_button_led(self.push_out, BUTTON_PLAY, LED_ON)   # Play lit
-            set_button_led(self.push_out, BUTTON_STOP, LED_DIM)  # Stop dim
-        else:
-            # Stopped state
-            set_lcd_segments(self.push_out, 2, "", "[ STOPPED ]", "", "")
-            set_button_led(self.push_out, BUTTON_PLAY, LED_DIM)  # Play dim
-            set_button_led(self.push_out, BUTTON_STOP, LED_ON)   # Stop lit
+        with self._send_lock:
+            playing = self.is_playing
+            if self._shown_playing is playing:
+                return
+            self._shown_playing = playing
+            send_frames(self.push_out, self._frames[playing])
 
     def play(self):
         """Start Seqtrak playback."""
@@ -148,7 +126,7 @@ class SeqtrakTransport:
             self.seqtrak_out.send(mido.Message('start'))
             self.is_playing = True
             self.update_display()
-            print("▶ PLAY - Sent START to Seqtrak")
+            log("▶ PLAY - Sent START to Seqtrak")
 
     def stop(self):
         """Stop Seqtrak playback."""
@@ -156,7 +134,7 @@ class SeqtrakTransport:
             self.seqtrak_out.send(mido.Message('stop'))
             self.is_playing = False
             self.update_display()
-            print("■ STOP - Sent STOP to Seqtrak")
+            log("■ STOP - Sent STOP to Seqtrak")
 
     def toggle(self):
         """Toggle between play and stop."""
@@ -202,12 +180,11 @@ def main():
 
     # Open ports
     with mido.open_output(push_out) as push_out_port, \
-         mido.open_output(seqtrak_port) as seqtrak_out_port, \
-         mido.open_input(push_in) as push_in_port:
+         mido.open_output(seqtrak_port) as seqtrak_out_port:
 
         # Initialize Push
         print("Initializing Push...")
-        send_sysex(push_out_port, USER_MODE)
+        send_sysex(push_out_port, PUSH1_USER_MODE)
         time.sleep(0.1)
 
         # Create transport controller
@@ -215,9 +192,7 @@ def main():
 
         # Set up LCD
         clear_lcd(push_out_port)
-        set_lcd_segments(push_out_port, 1, "SEQTRAK", "TRANSPORT", "CONTROL", "v0.1")
-        set_lcd_segments(push_out_port, 3, "Play: CC 85", "Stop: CC 29", "", "")
-        set_lcd_segments(push_out_port, 4, "Ctrl+C to exit", "", "", "open-push")
+        send_frames(push_out_port, BANNER_FRAMES)
 
         # Set initial button states
         transport.update_display()
@@ -230,21 +205,31 @@ def main():
         print("Press Ctrl+C to exit")
         print()
 
-        # Main loop - listen for button presses
-        try:
-            for msg in push_in_port:
-                if msg.type == 'control_change' and msg.value > 0:
-                    # Button pressed (not released)
-                    if msg.control == BUTTON_PLAY:
-                        transport.play()
-                    elif msg.control == BUTTON_STOP:
-                        transport.stop()
-                    else:
-                        # Show other button presses for debugging
-                        print(f"  Button CC {msg.control} pressed")
-
-        except KeyboardInterrupt:
-            print("\n\nExiting...")
+        start_log_writer()
+
+        # Button press handlers, indexed by CC number
+        handlers = [None] * 128
+        handlers[BUTTON_PLAY] = transport.play
+        handlers[BUTTON_STOP] = transport.stop
+
+        def on_message(msg):
+            if msg.type == 'control_change' and msg.value > 0:
+                # Button pressed (not released)
+                handler = handlers[msg.control]
+                if handler:
+                    handler()
+                else:
+                    # Show other button presses for debugging
+                    log(f"  Button CC {msg.control} pressed")
+
+        # Listen for button presses: mido registers the callback with
+        # rtmidi, which calls it from its own thread as messages arrive
+        with mido.open_input(push_in, callback=on_message):
+            try:
+                threading.Event().wait()
+            except KeyboardInterrupt:
+                flush_log()
+                print("\n\nExiting...")
 
         # Cleanup
         print("Cleaning up...")
@@ -253,6 +238,7 @@ def main():
         set_button_led(push_out_port, BUTTON_PLAY, LED_OFF)
         set_button_led(push_out_port, BUTTON_STOP, LED_OFF)
 
+    flush_log()
     print("Done!")
 
 
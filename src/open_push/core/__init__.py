@@ -9,5 +9,13 @@ This module provides low-level access to Push hardware:
 """
 
 from .constants import *
-from .hardware import Push1Hardware
-from .display import Push1Display
+from .hardware import Push1Hardware, find_push_ports, send_frames, send_sysex
+from .display import (
+    Push1Display,
+    clear_lcd,
+    format_segments,
+    lcd_frame,
+    segments_frame,
+    set_lcd_line,
+    set_lcd_segments,
+)
@@ -0,0 +1,51 @@
+"""
+Console Output
+==============
+
+Non-blocking console logging for MIDI callbacks.
+
+Lines are queued from the MIDI callback and written out by a background
+thread, so a slow terminal never stalls input handling.
+"""
+
+import sys
+import threading
+from collections import deque
+
+_log_queue = deque(maxlen=1024)
+_log_ready = threading.Event()
+_log_lock = threading.Lock()
+_log_thread = None
+
+
+def log(line: str):
+    """Queue a line for printing (safe and cheap to call from MIDI callbacks)."""
+    _log_queue.append(line)
+    _log_ready.set()
+
+
+def flush_log():
+    """Write out every queued line, in order."""
+    with _log_lock:
+        lines = []
+        while _log_queue:
+            lines.append(_log_queue.popleft())
+        if lines:
+            sys.stdout.write('\n'.join(lines) + '\n')
+            sys.stdout.flush()
+
+
+def _log_writer():
+    """Background thread: flush the log whenever lines arrive."""
+    while True:
+        _log_ready.wait()
+        _log_ready.clear()
+        flush_log()
+
+
+def start_log_writer():
+    """Start the background thread that prints queued lines (once per process)."""
+    global _log_thread
+    if _log_thread is None:
+        _log_thread = threading.Thread(target=_log_writer, daemon=True)
+        _log_thread.start()
@@ -5,6 +5,8 @@ Push Hardware Constants
 Protocol constants for Push 1 (and future Push 2/3 support).
 """
 
+from types import MappingProxyType
+
 # =============================================================================
 # SYSEX PROTOCOL
 # =============================================================================
@@ -46,6 +48,15 @@ PAD_NOTE_MAX = 99
 PAD_ROWS = 8
 PAD_COLS = 8
 
+# Pad note for each grid index (row * 8 + col), for loops over the grid
+PAD_NOTES = tuple(range(PAD_NOTE_MIN, PAD_NOTE_MAX + 1))
+
+# (row, col) for every MIDI note, None outside the pad range
+NOTE_TO_PAD = tuple(
+    divmod(note - PAD_NOTE_MIN, PAD_COLS) if PAD_NOTE_MIN <= note <= PAD_NOTE_MAX else None
+    for note in range(128)
+)
+
 
 def pad_to_note(row: int, col: int) -> int:
     """Convert grid position to MIDI note. Row 0 = bottom, Col 0 = left."""
@@ -54,9 +65,8 @@ def pad_to_note(row: int, col: int) -> int:
 
 def note_to_pad(note: int) -> tuple:
     """Convert MIDI note to grid position (row, col)."""
-    if PAD_NOTE_MIN <= note <= PAD_NOTE_MAX:
-        offset = note - PAD_NOTE_MIN
-        return (offset // PAD_COLS, offset % PAD_COLS)
+    if 0 <= note < 128:
+        return NOTE_TO_PAD[note]
     return None
 
 
@@ -64,8 +74,8 @@ def note_to_pad(note: int) -> tuple:
 # BUTTON CC NUMBERS
 # =============================================================================
 
-# Button CC mappings for Push 1
-BUTTON_CC = {
+# Button CC mappings for Push 1 (read-only, CC_TO_BUTTON is derived from it)
+BUTTON_CC = MappingProxyType({
     # Transport
     'play': 85,
     'record': 86,
@@ -136,10 +146,10 @@ BUTTON_CC = {
     'lower_6': 107,
     'lower_7': 108,
     'lower_8': 109,
-}
+})
 
 # Reverse lookup: CC number -> button name
-CC_TO_BUTTON = {v: k for k, v in BUTTON_CC.items()}
+CC_TO_BUTTON = MappingProxyType({v: k for k, v in BUTTON_CC.items()})
 
 # Encoder CC numbers (for touch detection and relative values)
 ENCODER_CC = {
@@ -230,23 +240,27 @@ def color_value(color) -> int:
 
 NOTE_NAMES = ['C', 'C#', 'D', 'D#', 'E', 'F', 'F#', 'G', 'G#', 'A', 'A#', 'B']
 
+# Name for every MIDI note ('C-1' ... 'G9')
+_NOTE_NAME = tuple(NOTE_NAMES[n % 12] + str((n // 12) - 1) for n in range(128))
+
+# Note for every name name_to_note accepts: upper case, octaves 0-9
+_NAME_TO_NOTE = {
+    name + str(octave): (octave + 1) * 12 + index
+    for octave in range(10)
+    for index, name in enumerate(NOTE_NAMES)
+}
+
 
 def note_name(midi_note: int) -> str:
     """Get note name with octave (e.g., 'C4' for MIDI note 60)."""
+    if 0 <= midi_note < 128:
+        return _NOTE_NAME[midi_note]
     return NOTE_NAMES[midi_note % 12] + str((midi_note // 12) - 1)
 
 
 def name_to_note(name: str) -> int:
     """Convert note name to MIDI note (e.g., 'C4' -> 60)."""
-    # Extract note and octave
-    if len(name) == 2:
-        note_part = name[0].upper()
-        octave = int(name[1])
-    elif len(name) == 3:
-        note_part = name[:2].upper()
-        octave = int(name[2])
-    else:
-        raise ValueError(f"Invalid note name: {name}")
-
-    note_index = NOTE_NAMES.index(note_part)
-    return (octave + 1) * 12 + note_index
+    try:
+        return _NAME_TO_NOTE[name.upper()]
+    except KeyError:
+        raise ValueError(f"Invalid note name: {name}") from None
@@ -15,6 +15,9 @@ Segment layout per line:
 """
 
 import mido
+import weakref
+from contextlib import contextmanager
+from functools import lru_cache
 from typing import List, Optional
 
 from .constants import (
@@ -25,6 +28,97 @@ from .constants import (
     LCD_SEGMENT_COUNT,
     LCD_FIELD_COUNT,
 )
+from .hardware import raw_sender, send_frames
+
+# Complete LCD SysEx prelude per line: header + [line, 00, 45, 00]
+LCD_LINE_PREFIX = {
+    line: bytes(PUSH1_SYSEX_HEADER + [addr, 0x00, 0x45, 0x00])
+    for line, addr in LCD_LINE_ADDRESSES.items()
+}
+
+
+def lcd_frame(line_num: int, text: str) -> bytes:
+    """
+    Build the raw SysEx frame that shows text on an LCD line.
+
+    Args:
+        line_num: 1-4
+        text: Padded/truncated to 68 characters; non-ASCII becomes '?'
+    """
+    text = text.ljust(LCD_CHARS_PER_LINE)[:LCD_CHARS_PER_LINE]
+    return b'\xF0' + LCD_LINE_PREFIX[line_num] + text.encode('ascii', 'replace') + b'\xF7'
+
+
+@lru_cache(maxsize=1024)
+def _pad(text: str, width: int, align: str) -> bytes:
+    """
+    Truncate and align text to width, encoded as ASCII ('?' for anything else).
+
+    Cached: labels like "Vol" or "Track 1" are redrawn far more often
+    than they change.
+    """
+    text = text[:width]
+    if align == 'center':
+        text = text.center(width)
+    elif align == 'right':
+        text = text.rjust(width)
+    else:  # left
+        text = text.ljust(width)
+    return text.encode('ascii', 'replace')
+
+
+def format_segments(*segments: str) -> str:
+    """
+    Format up to 4 segment texts into one 68-character LCD line.
+
+    Each segment is truncated to 17 characters and centered; missing
+    segments are blank.
+    """
+    segments = (segments + ('',) * LCD_SEGMENT_COUNT)[:LCD_SEGMENT_COUNT]
+    return ''.join(text[:LCD_CHARS_PER_SEGMENT].center(LCD_CHARS_PER_SEGMENT) for text in segments)
+
+
+def segments_frame(line_num: int, *segments: str) -> bytes:
+    """Build the raw LCD frame for a line of up to 4 centered segments."""
+    return lcd_frame(line_num, format_segments(*segments))
+
+
+# Text last sent per port, by line, so unchanged lines aren't resent.
+# Weakly keyed: entries go away with the port, and a new port never
+# inherits a closed one's state
+_lcd_shown = weakref.WeakKeyDictionary()
+
+
+def set_lcd_line(port, line_num: int, text: str):
+    """
+    Show text on an LCD line of a mido output port, without a Push1Display.
+
+    Args:
+        port: mido output port for Push
+        line_num: 1-4
+        text: Padded/truncated to 68 characters
+    """
+    text = text.ljust(LCD_CHARS_PER_LINE)[:LCD_CHARS_PER_LINE]
+
+    shown = _lcd_shown.setdefault(port, {})
+    if shown.get(line_num) == text:
+        return
+    shown[line_num] = text
+
+    send_frames(port, (lcd_frame(line_num, text),))
+
+
+def set_lcd_segments(port, line_num: int, *segments: str):
+    """Set an LCD line from up to 4 segments (17 chars each, centered)."""
+    set_lcd_line(port, line_num, format_segments(*segments))
+
+
+def clear_lcd(port):
+    """Clear all LCD lines."""
+    # Always resend: the device may have been cleared behind our back
+    _lcd_shown.pop(port, None)
+    for line in range(1, 5):
+        set_lcd_line(port, line, "")
 
 
 class Push1Display:
@@ -42,6 +136,11 @@ class Push1Display:
         display.clear()
     """
 
+    # Buffer offset of each line and of each segment within a line. Range
+    # checks are lookups here: anything missing is out of range
+    _LINE_BASE = {line: (line - 1) * LCD_CHARS_PER_LINE for line in range(1, 5)}
+    _SEG_OFFSETS = {seg: seg * LCD_CHARS_PER_SEGMENT for seg in range(LCD_SEGMENT_COUNT)}
+
     def __init__(self, port):
         """
         Initialize display.
@@ -50,23 +149,75 @@ class Push1Display:
             port: mido output port for Push
         """
         self.port = port
-        # Internal buffer: 4 lines x 68 characters
-        self.buffer: List[List[str]] = [[' '] * LCD_CHARS_PER_LINE for _ in range(4)]
-
-    def _send_sysex(self, data: list):
-        """Send a SysEx message."""
-        msg = mido.Message('sysex', data=PUSH1_SYSEX_HEADER + data)
-        self.port.send(msg)
+        # rtmidi send_message behind the port, when there is one
+        self._raw_send = raw_sender(port)
+        # Internal buffer: 4 lines x 68 ASCII bytes, back to back
+        self.buffer = bytearray(b' ' * (4 * LCD_CHARS_PER_LINE))
+        # Lines changed since they were last sent
+        self._dirty = [False] * 4
+        # Lines sent at least once: until then the hardware may show anything
+        self._synced = [False] * 4
+        # Set inside batch(): changes are only sent when it ends
+        self._batching = False
+
+    def _send_frame(self, frame: bytes):
+        """Send a complete raw SysEx frame (F0 ... F7)."""
+        if self._raw_send:
+            self._raw_send(frame)
+        else:
+            self.port.send(mido.Message.from_bytes(frame))
 
     def _flush_line(self, line_num: int):
         """Send a line from buffer to hardware."""
-        if not (1 <= line_num <= 4):
+        base = self._LINE_BASE.get(line_num)
+        if base is None:
             return
-        line_addr = LCD_LINE_ADDRESSES[line_num]
-        text = ''.join(self.buffer[line_num - 1])
-        data = [line_addr, 0x00, 0x45, 0x00]
-        data.extend([ord(c) for c in text])
-        self._send_sysex(data)
+        self._dirty[line_num - 1] = False
+        self._synced[line_num - 1] = True
+        self._send_frame(b'\xF0' + LCD_LINE_PREFIX[line_num]
+                         + self.buffer[base:base + LCD_CHARS_PER_LINE] + b'\xF7')
+
+    def _write(self, line_num: int, start: int, data: bytes) -> bool:
+        """
+        Copy already-aligned ASCII bytes into the buffer.
+
+        Returns False when the line is already showing exactly this, so
+        the caller can skip sending it.
+        """
+        base = self._LINE_BASE[line_num] + start
+        end = base + len(data)
+        if self.buffer[base:end] == data and self._synced[line_num - 1]:
+            return False
+        self.buffer[base:end] = data
+        return True
+
+    def _touch(self, line_num: int):
+        """Mark a line changed and send it, unless inside batch()."""
+        self._dirty[line_num - 1] = True
+        if not self._batching:
+            self._flush_line(line_num)
+
+    @contextmanager
+    def batch(self):
+        """
+        Defer hardware updates until the block ends, then send each
+        changed line once.
+
+        Usage:
+            with display.batch():
+                display.set_field(1, 0, "Vol")
+                display.set_field(1, 1, "Pan")
+        """
+        outer = self._batching
+        self._batching = True
+        try:
+            yield self
+        finally:
+            self._batching = outer
+            if not outer:
+                for line in range(1, 5):
+                    if self._dirty[line - 1]:
+                        self._flush_line(line)
 
     # =========================================================================
     # FULL LINE METHODS
@@ -74,17 +225,17 @@ class Push1Display:
 
     def clear(self):
         """Clear all lines."""
-        for i in range(4):
-            self.buffer[i] = [' '] * LCD_CHARS_PER_LINE
-        for line in range(1, 5):
-            self._flush_line(line)
+        with self.batch():
+            self.buffer[:] = b' ' * (4 * LCD_CHARS_PER_LINE)
+            for line in range(1, 5):
+                self._touch(line)
 
     def clear_line(self, line_num: int):
         """Clear a single line."""
-        if not (1 <= line_num <= 4):
+        if line_num not in self._LINE_BASE:
             return
-        self.buffer[line_num - 1] = [' '] * LCD_CHARS_PER_LINE
-        self._flush_line(line_num)
+        if self._write(line_num, 0, b' ' * LCD_CHARS_PER_LINE):
+            self._touch(line_num)
 
     def set_line(self, line_num: int, text: str):
         """
@@ -94,11 +245,10 @@ class Push1Display:
             line_num: 1-4
             text: Text to display (up to 68 characters)
         """
-        if not (1 <= line_num <= 4):
+        if line_num not in self._LINE_BASE:
             return
-        text = text.ljust(LCD_CHARS_PER_LINE)[:LCD_CHARS_PER_LINE]
-        self.buffer[line_num - 1] = list(text)
-        self._flush_line(line_num)
+        if self._write(line_num, 0, _pad(text, LCD_CHARS_PER_LINE, 'left')):
+            self._touch(line_num)
 
     # =========================================================================
     # SEGMENT METHODS (4 segments of 17 chars each)
@@ -114,28 +264,14 @@ class Push1Display:
             text: Up to 17 characters
             align: 'left', 'center', or 'right'
         """
-        if not (1 <= line_num <= 4):
+        if line_num not in self._LINE_BASE:
             return
-        if not (0 <= segment <= 3):
+        start = self._SEG_OFFSETS.get(segment)
+        if start is None:
             return
 
-        # Truncate to segment width
-        text = text[:LCD_CHARS_PER_SEGMENT]
-
-        # Apply alignment
-        if align == 'center':
-            text = text.center(LCD_CHARS_PER_SEGMENT)
-        elif align == 'right':
-            text = text.rjust(LCD_CHARS_PER_SEGMENT)
-        else:  # left
-            text = text.ljust(LCD_CHARS_PER_SEGMENT)
-
-        # Calculate position in buffer
-        start = segment * LCD_CHARS_PER_SEGMENT
-        for i, char in enumerate(text):
-            self.buffer[line_num - 1][start + i] = char
-
-        self._flush_line(line_num)
+        if self._write(line_num, start, _pad(text, LCD_CHARS_PER_SEGMENT, align)):
+            self._touch(line_num)
 
     def set_segments(self, line_num: int, texts: List[str], align: str = 'center'):
         """
@@ -146,26 +282,14 @@ class Push1Display:
             texts: List of up to 4 strings
             align: 'left', 'center', or 'right'
         """
-        if not (1 <= line_num <= 4):
+        if line_num not in self._LINE_BASE:
             return
 
-        # Process each segment
-        for i in range(LCD_SEGMENT_COUNT):
-            text = texts[i] if i < len(texts) else ""
-            text = text[:LCD_CHARS_PER_SEGMENT]
-
-            if align == 'center':
-                text = text.center(LCD_CHARS_PER_SEGMENT)
-            elif align == 'right':
-                text = text.rjust(LCD_CHARS_PER_SEGMENT)
-            else:
-                text = text.ljust(LCD_CHARS_PER_SEGMENT)
-
-            start = i * LCD_CHARS_PER_SEGMENT
-            for j, char in enumerate(text):
-                self.buffer[line_num - 1][start + j] = char
-
-        self._flush_line(line_num)
+        # Segments tile the whole line, so build it and write it in one go
+        texts = (tuple(texts) + ('',) * LCD_SEGMENT_COUNT)[:LCD_SEGMENT_COUNT]
+        line = b''.join(_pad(text, LCD_CHARS_PER_SEGMENT, align) for text in texts)
+        if self._write(line_num, 0, line):
+            self._touch(line_num)
 
     # =========================================================================
     # FIELD METHODS (8 fields for encoder columns)
@@ -183,6 +307,7 @@ class Push1Display:
         (51, 8),   # Field 6: chars 51-58
         (59, 9),   # Field 7: chars 59-67
     ]
+    _FIELD_SLOTS = dict(enumerate(FIELD_POSITIONS))
 
     def set_field(self, line_num: int, field: int, text: str, align: str = 'center'):
         """
@@ -194,25 +319,15 @@ class Push1Display:
             text: Up to 8-9 characters
             align: 'left', 'center', or 'right'
         """
-        if not (1 <= line_num <= 4):
+        if line_num not in self._LINE_BASE:
             return
-        if not (0 <= field <= 7):
+        slot = self._FIELD_SLOTS.get(field)
+        if slot is None:
             return
 
-        start, width = self.FIELD_POSITIONS[field]
-        text = text[:width]
-
-        if align == 'center':
-            text = text.center(width)
-        elif align == 'right':
-            text = text.rjust(width)
-        else:
-            text = text.ljust(width)
-
-        for i, char in enumerate(text):
-            self.buffer[line_num - 1][start + i] = char
-
-        self._flush_line(line_num)
+        start, width = slot
+        if self._write(line_num, start, _pad(text, width, align)):
+            self._touch(line_num)
 
     def set_fields(self, line_num: int, texts: List[str], align: str = 'center'):
         """
@@ -223,25 +338,15 @@ class Push1Display:
             texts: List of up to 8 strings
             align: 'left', 'center', or 'right'
         """
-        if not (1 <= line_num <= 4):
+        if line_num not in self._LINE_BASE:
             return
 
-        for field in range(LCD_FIELD_COUNT):
-            text = texts[field] if field < len(texts) else ""
-            start, width = self.FIELD_POSITIONS[field]
-            text = text[:width]
-
-            if align == 'center':
-                text = text.center(width)
-            elif align == 'right':
-                text = text.rjust(width)
-            else:
-                text = text.ljust(width)
-
-            for i, char in enumerate(text):
-                self.buffer[line_num - 1][start + i] = char
-
-        self._flush_line(line_num)
+        # Fields tile the whole line, so build it and write it in one go
+        texts = (tuple(texts) + ('',) * LCD_FIELD_COUNT)[:LCD_FIELD_COUNT]
+        line = b''.join(_pad(text, width, align)
+                        for text, (_, width) in zip(texts, self.FIELD_POSITIONS))
+        if self._write(line_num, 0, line):
+            self._touch(line_num)
 
     # =========================================================================
     # UTILITY METHODS
@@ -249,14 +354,16 @@ class Push1Display:
 
     def get_line(self, line_num: int) -> str:
         """Get the current text of a line from the buffer."""
-        if not (1 <= line_num <= 4):
+        base = self._LINE_BASE.get(line_num)
+        if base is None:
             return ""
-        return ''.join(self.buffer[line_num - 1])
+        return self.buffer[base:base + LCD_CHARS_PER_LINE].decode('ascii')
 
     def get_segment(self, line_num: int, segment: int) -> str:
         """Get the current text of a segment from the buffer."""
-        if not (1 <= line_num <= 4) or not (0 <= segment <= 3):
+        base = self._LINE_BASE.get(line_num)
+        offset = self._SEG_OFFSETS.get(segment)
+        if base is None or offset is None:
             return ""
-        start = segment * LCD_CHARS_PER_SEGMENT
-        end = start + LCD_CHARS_PER_SEGMENT
-        return ''.join(self.buffer[line_num - 1][start:end])
+        start = base + offset
+        return self.buffer[start:start + LCD_CHARS_PER_SEGMENT].decode('ascii')
@@ -8,7 +8,7 @@ Handles port detection, SysEx communication, and LED control.
 
 import mido
 import time
-from typing import Optional, Tuple, Callable
+from typing import Optional, Sequence, Tuple, Callable
 
 from .constants import (
     PUSH1_SYSEX_HEADER,
@@ -21,6 +21,65 @@ from .constants import (
 )
 
 
+# Prebuilt "LED off" frames for the bulk clear operations
+_PADS_OFF = tuple(bytes((0x90, note, 0)) for note in range(PAD_NOTE_MIN, PAD_NOTE_MAX + 1))
+_BUTTONS_OFF = tuple(bytes((0xB0, cc, 0)) for cc in BUTTON_CC.values())
+
+# How long find_ports(use_cache=True) reuses its last scan (seconds)
+PORT_CACHE_TTL = 2.0
+
+
+def _port_score(name: str) -> int:
+    """Rank a port name: 2 = Push User port, 1 = other Push port, 0 = not Push."""
+    if 'Ableton Push' not in name:
+        return 0
+    return 2 if 'User' in name else 1
+
+
+def _best_push_port(names) -> Optional[str]:
+    """Return the highest-ranked Push port in names (first wins ties), or None."""
+    best = max(names, key=_port_score, default=None)
+    return best if best is not None and _port_score(best) else None
+
+
+def find_push_ports() -> Tuple[Optional[str], Optional[str]]:
+    """
+    Find Push MIDI ports, preferring the User ports (allows Push to work outside Live).
+
+    Returns:
+        Tuple of (input_port_name, output_port_name), either may be None
+    """
+    return _best_push_port(mido.get_input_names()), _best_push_port(mido.get_output_names())
+
+
+def raw_sender(port) -> Optional[Callable]:
+    """Return the rtmidi send_message behind a mido output port, or None."""
+    rt = getattr(port, '_rt', None)
+    return rt.send_message if hasattr(rt, 'send_message') else None
+
+
+def send_frames(port, frames):
+    """
+    Send prebuilt raw MIDI frames to a mido output port, back to back.
+
+    With the rtmidi backend each frame goes straight to send_message,
+    skipping mido's Message layer. rtmidi takes one message per call,
+    so frames are never concatenated.
+    """
+    send = raw_sender(port)
+    if send:
+        for frame in frames:
+            send(frame)
+    else:
+        for frame in frames:
+            port.send(mido.Message.from_bytes(frame))
+
+
+def send_sysex(port, data: list):
+    """Send a Push 1 SysEx message (header added here) to a mido output port."""
+    send_frames(port, (bytes([0xF0] + PUSH1_SYSEX_HEADER + data + [0xF7]),))
+
+
 class Push1Hardware:
     """
     Low-level interface to Push 1 hardware.
@@ -46,42 +105,44 @@ class Push1Hardware:
         self.output_port_name: Optional[str] = None
         self._input_port = None
         self._output_port = None
+        self._raw_send: Optional[Callable] = None
         self._connected = False
+        self._port_cache: Optional[Tuple[Optional[str], Optional[str]]] = None
+        self._port_cache_time = 0.0
 
     @property
     def connected(self) -> bool:
         """Check if connected to Push hardware."""
         return self._connected and self._output_port is not None
 
-    def find_ports(self) -> Tuple[Optional[str], Optional[str]]:
+    def find_ports(self, use_cache: bool = False) -> Tuple[Optional[str], Optional[str]]:
         """
         Find Push MIDI ports.
 
+        Args:
+            use_cache: Reuse a scan made within the last PORT_CACHE_TTL
+                seconds instead of enumerating MIDI devices again, for
+                callers that poll; a hot-plugged Push may not show up
+                until the cache expires
+
         Returns:
             Tuple of (input_port_name, output_port_name)
         """
-        input_name = None
-        output_name = None
-
-        # Prefer User ports (allows Push to work outside Live)
-        for name in mido.get_input_names():
-            if 'Ableton Push' in name and 'User' in name:
-                input_name = name
-                break
-            elif 'Ableton Push' in name and input_name is None:
-                input_name = name
-
-        for name in mido.get_output_names():
-            if 'Ableton Push' in name and 'User' in name:
-                output_name = name
-                break
-            elif 'Ableton Push' in name and output_name is None:
-                output_name = name
-
+        now = time.monotonic()
+        if (not use_cache or self._port_cache is None
+                or now - self._port_cache_time >= PORT_CACHE_TTL):
+            self._port_cache = find_push_ports()
+            self._port_cache_time = now
+        input_name, output_name = self._port_cache
         self.input_port_name = input_name
         self.output_port_name = output_name
         return input_name, output_name
 
+    def rescan_ports(self) -> Tuple[Optional[str], Optional[str]]:
+        """Drop the cached port scan and find Push ports again."""
+        self._port_cache = None
+        return self.find_ports()
+
     def connect(self) -> bool:
         """
         Connect to Push hardware.
@@ -101,6 +162,9 @@ class Push1Hardware:
 
         try:
             self._output_port = mido.open_output(self.output_port_name)
+            # Frames built here are already valid MIDI, so skip mido's
+            # Message layer and use the rtmidi backend directly when present
+            self._raw_send = raw_sender(self._output_port)
             if self.input_port_name:
                 self._input_port = mido.open_input(self.input_port_name)
             self._connected = True
@@ -117,18 +181,30 @@ class Push1Hardware:
         if self._output_port:
             self._output_port.close()
             self._output_port = None
+        self._raw_send = None
         self._connected = False
 
     # =========================================================================
     # SYSEX COMMUNICATION
     # =========================================================================
 
-    def send_sysex(self, data: list):
-        """Send a SysEx message to Push."""
+    def send_raw(self, frame: bytes):
+        """
+        Send one complete MIDI message as raw bytes.
+
+        Args:
+            frame: Status byte first; SysEx includes the F0 ... F7 framing
+        """
         if not self._output_port:
             return
-        msg = mido.Message('sysex', data=PUSH1_SYSEX_HEADER + data)
-        self._output_port.send(msg)
+        if self._raw_send:
+            self._raw_send(frame)
+        else:
+            self._output_port.send(mido.Message.from_bytes(frame))
+
+    def send_sysex(self, data: list):
+        """Send a SysEx message to Push."""
+        self.send_raw(bytes([0xF0] + PUSH1_SYSEX_HEADER + data + [0xF7]))
 
     def set_user_mode(self):
         """Switch Push to User Mode (away from Live control)."""
@@ -157,9 +233,20 @@ class Push1Hardware:
         if not (PAD_NOTE_MIN <= note <= PAD_NOTE_MAX):
             return
 
-        velocity = color_value(color)
-        msg = mido.Message('note_on', note=note, velocity=velocity)
-        self._output_port.send(msg)
+        self.send_raw(bytes((0x90, note, color_value(color))))
+
+    def set_pad_color_raw(self, note: int, velocity: int):
+        """
+        Set a pad's LED from an already-resolved velocity.
+
+        Fast path for animations: resolve colors once with color_value()
+        and repaint with this. The note is not range-checked.
+
+        Args:
+            note: MIDI note number (36-99)
+            velocity: Color velocity value (0-127)
+        """
+        self.send_raw(bytes((0x90, note, velocity)))
 
     def set_pad_color_xy(self, row: int, col: int, color):
         """
@@ -175,13 +262,36 @@ class Push1Hardware:
 
     def clear_all_pads(self):
         """Turn off all pad LEDs."""
-        for note in range(PAD_NOTE_MIN, PAD_NOTE_MAX + 1):
-            self.set_pad_color(note, 'off')
+        self.set_all_pads('off')
 
     def set_all_pads(self, color):
         """Set all pads to a single color."""
-        for note in range(PAD_NOTE_MIN, PAD_NOTE_MAX + 1):
-            self.set_pad_color(note, color)
+        if not self._output_port:
+            return
+        # Resolve the color once and send the 64 frames in one tight loop
+        velocity = color_value(color)
+        if velocity == 0:
+            send_frames(self._output_port, _PADS_OFF)
+            return
+        send_frames(self._output_port, [
+            bytes((0x90, note, velocity)) for note in range(PAD_NOTE_MIN, PAD_NOTE_MAX + 1)
+        ])
+
+    def paint_grid(self, velocities: Sequence[int]):
+        """
+        Repaint the pad grid from already-resolved velocities.
+
+        Args:
+            velocities: Up to 64 values in pad note order (36 first,
+                bottom-left to top-right); see color_value()
+        """
+        if not self._output_port:
+            return
+        # One frame per pad: rtmidi takes a single message per call
+        send_frames(self._output_port, [
+            bytes((0x90, note, velocity))
+            for note, velocity in zip(range(PAD_NOTE_MIN, PAD_NOTE_MAX + 1), velocities)
+        ])
 
     # =========================================================================
     # BUTTON LED CONTROL
@@ -207,11 +317,7 @@ class Push1Hardware:
             cc: Control Change number
             color: Color name (str) or value (int)
         """
-        if not self._output_port:
-            return
-        value = color_value(color)
-        msg = mido.Message('control_change', control=cc, value=value)
-        self._output_port.send(msg)
+        self.send_raw(bytes((0xB0, cc, color_value(color))))
 
     def clear_button(self, button: str):
         """Turn off a button's LED."""
@@ -219,8 +325,8 @@ class Push1Hardware:
 
     def clear_all_buttons(self):
         """Turn off all button LEDs."""
-        for cc in BUTTON_CC.values():
-            self.set_button_color_cc(cc, 'off')
+        if self._output_port:
+            send_frames(self._output_port, _BUTTONS_OFF)
 
     # =========================================================================
     # INPUT HANDLING
@@ -9,7 +9,7 @@ In an isomorphic layout, the same fingering pattern produces
 the same chord/interval in any key.
 """
 
-from typing import Dict, Optional, Tuple, List
+from typing import Optional, Tuple, List
 from .scales import SCALES, is_in_scale, is_root_note
 
 
@@ -75,18 +75,16 @@ class IsomorphicLayout:
         self.scale = SCALES[self.scale_name]
         self.in_key_row_interval = 3  # Scale degrees per row
 
-        # Note map cache (chromatic mode)
-        self._note_map: Dict[int, int] = {}
+        # Note map cache (chromatic mode), indexed by pad_note - 36
+        self._note_map: List[int] = []
         self._rebuild_map()
 
     def _rebuild_map(self):
         """Rebuild the chromatic note map."""
-        self._note_map.clear()
-        for row in range(8):
-            for col in range(8):
-                pad_note = 36 + (row * 8) + col
-                midi_note = self.root_note + (row * self.row_interval) + (col * self.col_interval)
-                self._note_map[pad_note] = midi_note
+        # Outer sum of row starts and column offsets, flattened row by row
+        row_starts = [self.root_note + (row * self.row_interval) for row in range(8)]
+        col_offsets = [col * self.col_interval for col in range(8)]
+        self._note_map = [start + offset for start in row_starts for offset in col_offsets]
 
     # =========================================================================
     # ROOT NOTE AND OCTAVE
@@ -194,13 +192,15 @@ class IsomorphicLayout:
         Returns:
             Output MIDI note
         """
+        index = pad_note - 36
         if self.in_key_mode:
-            row = (pad_note - 36) // 8
-            col = (pad_note - 36) % 8
-            return self._get_in_key_note(row, col)
+            # 8 pads per row: row = index // 8, col = index % 8
+            return self._get_in_key_note(index >> 3, index & 7)
         # Chromatic mode: add scale_root so first note is the selected key
         # e.g., if key is D (scale_root=2), first note shifts from C2 to D2
-        return self._note_map.get(pad_note, pad_note) + self.scale_root
+        if 0 <= index < 64:
+            return self._note_map[index] + self.scale_root
+        return pad_note + self.scale_root
 
     def get_note_at(self, row: int, col: int) -> int:
         """
@@ -216,8 +216,10 @@ class IsomorphicLayout:
         if self.in_key_mode:
             return self._get_in_key_note(row, col)
         # Chromatic mode: add scale_root so first note is the selected key
-        pad_note = 36 + (row * 8) + col
-        return self._note_map.get(pad_note, 0) + self.scale_root
+        index = (row * 8) + col
+        if 0 <= index < 64:
+            return self._note_map[index] + self.scale_root
+        return self.scale_root
 
     def _get_in_key_note(self, row: int, col: int) -> int:
         """
@@ -226,23 +228,13 @@ class IsomorphicLayout:
         In this mode, pads map to scale degrees, not semitones.
         This ensures all pads produce in-scale notes.
         """
-        scale_len = len(self.scale)
-
-        # Calculate which scale degree this pad represents
-        scale_degree = (row * self.in_key_row_interval) + col
-
-        # Calculate octave offset and position within scale
-        octave_offset = scale_degree // scale_len
-        note_index = scale_degree % scale_len
+        scale = self.scale
 
-        # Get the actual semitone offset from the scale
-        semitone = self.scale[note_index]
+        # Scale degree of this pad -> (octave offset, position within scale)
+        octave_offset, note_index = divmod((row * self.in_key_row_interval) + col, len(scale))
 
-        # Calculate final MIDI note
-        base_note = self.root_note + self.scale_root
-        midi_note = base_note + (octave_offset * 12) + semitone
-
-        return midi_note
+        # Base note + whole octaves + the semitone offset from the scale
+        return self.root_note + self.scale_root + (octave_offset * 12) + scale[note_index]
 
     # =========================================================================
     # GRID INFORMATION
@@ -286,10 +278,8 @@ class IsomorphicLayout:
         Returns:
             8x8 list of MIDI note numbers
         """
-        grid = []
-        for row in range(8):
-            row_notes = []
-            for col in range(8):
-                row_notes.append(self.get_note_at(row, col))
-            grid.append(row_notes)
-        return grid
+        if self.in_key_mode:
+            return [[self._get_in_key_note(row, col) for col in range(8)] for row in range(8)]
+        # Chromatic mode: the note map already holds the grid row by row
+        notes = [note + self.scale_root for note in self._note_map]
+        return [notes[start:start + 8] for start in range(0, 64, 8)]
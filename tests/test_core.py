@@ -194,6 +194,153 @@ def test_button_mappings():
     print("  Button mappings OK")
 
 
+class FakePort:
+    """Stand-in mido output port that records every frame sent to it."""
+
+    def __init__(self, raw=False):
+        self.sent = []
+        if raw:
+            # Mimic mido's rtmidi backend, which raw_sender() uses directly
+            self._rt = self
+
+    def send_message(self, frame):
+        self.sent.append(bytes(frame))
+
+    def send(self, msg):
+        self.sent.append(bytes(msg.bytes()))
+
+
+def test_note_tables():
+    """Test the precomputed pad and note name tables."""
+    print("Testing note tables...")
+
+    from open_push.core.constants import (
+        PAD_NOTES,
+        NOTE_TO_PAD,
+        pad_to_note,
+        note_to_pad,
+        note_name,
+        name_to_note,
+    )
+
+    # Pad tables
+    assert PAD_NOTES == tuple(range(36, 100))
+    assert len(NOTE_TO_PAD) == 128
+    assert NOTE_TO_PAD[35] is None
+    assert NOTE_TO_PAD[100] is None
+    for row in range(8):
+        for col in range(8):
+            assert NOTE_TO_PAD[pad_to_note(row, col)] == (row, col)
+    assert note_to_pad(20) is None
+    assert note_to_pad(200) is None
+
+    # Note names round trip for every MIDI note from octave 0 up
+    for note in range(12, 128):
+        assert name_to_note(note_name(note)) == note
+    assert note_name(61) == 'C#4'
+    assert note_name(0) == 'C-1'
+    assert name_to_note('c#4') == 61  # Case insensitive
+
+    try:
+        name_to_note('H4')
+        assert False, "name_to_note('H4') should raise ValueError"
+    except ValueError:
+        pass
+
+    print("  Note tables OK")
+
+
+def test_port_detection():
+    """Test Push port ranking without real MIDI ports."""
+    print("Testing port detection...")
+
+    from open_push.core import hardware
+
+    inputs = ['IAC Bus 1', 'Ableton Push Live Port', 'Ableton Push User Port']
+    outputs = ['Ableton Push Live Port', 'Some Synth']
+
+    saved = hardware.mido.get_input_names, hardware.mido.get_output_names
+    hardware.mido.get_input_names = lambda: inputs
+    hardware.mido.get_output_names = lambda: outputs
+    try:
+        # User port preferred, any Push port as fallback
+        assert hardware.find_push_ports() == (
+            'Ableton Push User Port', 'Ableton Push Live Port')
+
+        outputs[:] = ['Some Synth']
+        assert hardware.find_push_ports()[1] is None
+    finally:
+        hardware.mido.get_input_names, hardware.mido.get_output_names = saved
+
+    print("  Port detection OK")
+
+
+def test_frame_sending():
+    """Test raw frame sending and full-grid repaints."""
+    print("Testing frame sending...")
+
+    from open_push.core.hardware import Push1Hardware, raw_sender, send_frames
+
+    frames = [bytes((0x90, 36, 5)), bytes((0xB0, 85, 1))]
+
+    # Raw backend and mido fallback send the same frames, one per message
+    for raw in (True, False):
+        port = FakePort(raw=raw)
+        send_frames(port, frames)
+        assert port.sent == frames
+
+    push = Push1Hardware()
+    push.paint_grid([1] * 64)  # Not connected: nothing to send to
+
+    port = FakePort(raw=True)
+    push._output_port = port
+    push._raw_send = raw_sender(port)
+    push.paint_grid(range(64))
+    assert port.sent == [bytes((0x90, 36 + i, i)) for i in range(64)]
+
+    print("  Frame sending OK")
+
+
+def test_display_updates():
+    """Test LCD batching and skipping of unchanged lines."""
+    print("Testing display updates...")
+
+    from open_push.core.display import Push1Display, lcd_frame
+
+    port = FakePort()
+    display = Push1Display(port)
+
+    # First write always goes out, even if it matches the blank buffer
+    display.set_line(1, "")
+    assert port.sent == [lcd_frame(1, "")]
+
+    # Unchanged text is not resent
+    display.set_line(1, "")
+    display.set_segment(2, 0, "Vol")
+    display.set_segment(2, 0, "Vol")
+    assert len(port.sent) == 2
+
+    # batch() sends each changed line once, after the (nested) block
+    port.sent.clear()
+    with display.batch():
+        display.set_field(3, 0, "A")
+        with display.batch():
+            display.set_field(3, 1, "B")
+        display.set_fields(4, ["X", "Y"])
+        assert port.sent == []
+    assert port.sent == [
+        lcd_frame(3, display.get_line(3)),
+        lcd_frame(4, display.get_line(4)),
+    ]
+
+    # clear() always resends all four lines
+    port.sent.clear()
+    display.clear()
+    assert port.sent == [lcd_frame(line, "") for line in range(1, 5)]
+
+    print("  Display updates OK")
+
+
 def run_all_tests():
     """Run all tests."""
     print()
@@ -208,6 +355,10 @@ def run_all_tests():
         test_layout()
         test_display_buffer()
         test_button_mappings()
+        test_note_tables()
+        test_port_detection()
+        test_frame_sending()
+        test_display_updates()
 
         print()
         print("=" * 50)